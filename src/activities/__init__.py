@@ -6,6 +6,7 @@ from src.activities.ocr import (
     PageOCRResult,
     get_pdf_page_count_activity,
     ocr_page_activity,
+    ocr_pages_batch_activity,
 )
 
 # Translation activities and dataclasses
@@ -19,6 +20,7 @@ from src.activities.translation import (
 from src.activities.site_generation import (
     SiteOutput,
     generate_site_activity,
+    create_vector_overlay_pdf_activity,
     _generate_main_index,  # Used by cli.py
 )
 
@@ -26,6 +28,7 @@ from src.activities.site_generation import (
 from src.activities.cleanup import (
     ftfy_cleanup_activity,
     rule_based_cleanup_activity,
+    deterministic_cleanup_activity,
     gemini_cleanup_activity,
 )
 
@@ -40,6 +43,7 @@ __all__ = [
     "PageOCRResult",
     "get_pdf_page_count_activity",
     "ocr_page_activity",
+    "ocr_pages_batch_activity",
     # Translation
     "TranslatedBlock",
     "TranslationResult",
@@ -47,10 +51,12 @@ __all__ = [
     # Site generation
     "SiteOutput",
     "generate_site_activity",
+    "create_vector_overlay_pdf_activity",
     "_generate_main_index",
     # Cleanup
     "ftfy_cleanup_activity",
     "rule_based_cleanup_activity",
+    "deterministic_cleanup_activity",
     "gemini_cleanup_activity",
     # Product search
     "search_product_url_activity",
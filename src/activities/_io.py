@@ -0,0 +1,22 @@
+"""Shared translations.json read/write helpers for activities."""
+
+from pathlib import Path
+
+import orjson
+
+
+def load_translations(json_path: str | Path) -> dict:
+    """Load a translations.json file."""
+    return orjson.loads(Path(json_path).read_bytes())
+
+
+def save_translations(json_path: str | Path, translations_data: dict) -> None:
+    """
+    Write a translations.json file: 2-space indent, UTF-8 (not ASCII-escaped)
+    and a trailing newline, matching what Prettier leaves in the repo.
+    """
+    Path(json_path).write_bytes(
+        orjson.dumps(
+            translations_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    )
@@ -1,7 +1,11 @@
 """Cleanup activities for improving translation quality."""
 
+import asyncio
+
 from temporalio import activity
 
+from src.activities._io import load_translations, save_translations
+
 
 @activity.defn
 async def ftfy_cleanup_activity(json_path: str) -> dict:
@@ -18,21 +22,18 @@ async def ftfy_cleanup_activity(json_path: str) -> dict:
         Dict with fixes count
     """
     from src.cleanup import stage1_ftfy_cleanup
-    import json
 
     activity.logger.info(f"Stage 1 (ftfy): {json_path}")
 
     try:
         # Load translations.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            translations_data = json.load(f)
+        translations_data = await asyncio.to_thread(load_translations, json_path)
 
-        # Run ftfy cleanup
-        fixes = stage1_ftfy_cleanup(translations_data)
+        # Run ftfy cleanup - pure-Python CPU work, keep it off the event loop
+        fixes = await asyncio.to_thread(stage1_ftfy_cleanup, translations_data)
 
         # Save updated file
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(translations_data, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(save_translations, json_path, translations_data)
 
         activity.logger.info(f"Stage 1 complete: {fixes} blocks fixed")
 
@@ -69,21 +70,18 @@ async def rule_based_cleanup_activity(json_path: str) -> dict:
         Dict with removals count
     """
     from src.cleanup import stage2_rule_based_cleanup
-    import json
 
     activity.logger.info(f"Stage 2 (rule-based): {json_path}")
 
     try:
         # Load translations.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            translations_data = json.load(f)
+        translations_data = await asyncio.to_thread(load_translations, json_path)
 
-        # Run rule-based cleanup
-        removals = stage2_rule_based_cleanup(translations_data)
+        # Run rule-based cleanup (off the event loop, like stage 1)
+        removals = await asyncio.to_thread(stage2_rule_based_cleanup, translations_data)
 
         # Save updated file
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(translations_data, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(save_translations, json_path, translations_data)
 
         activity.logger.info(f"Stage 2 complete: {removals} blocks removed")
 
@@ -101,6 +99,57 @@ async def rule_based_cleanup_activity(json_path: str) -> dict:
         }
 
 
+@activity.defn
+async def deterministic_cleanup_activity(json_path: str) -> dict:
+    """
+    Stages 1 and 2 cleanup in one pass: ftfy fixes, then rule-based removals.
+
+    Loads translations.json once and writes it once (only if either stage
+    changed something), instead of a load/save round trip per stage.
+
+    Args:
+        json_path: Path to translations.json file
+
+    Returns:
+        Dict with fixes and removals counts
+    """
+    from src.cleanup import stage1_ftfy_cleanup, stage2_rule_based_cleanup
+
+    activity.logger.info(f"Stages 1-2 (ftfy + rule-based): {json_path}")
+
+    try:
+        # Load translations.json
+        translations_data = await asyncio.to_thread(load_translations, json_path)
+
+        # Run both deterministic stages on the in-memory data. ftfy is pure
+        # Python and CPU-bound, so keep it off the event loop
+        fixes = await asyncio.to_thread(stage1_ftfy_cleanup, translations_data)
+        removals = await asyncio.to_thread(stage2_rule_based_cleanup, translations_data)
+
+        # Save updated file
+        if fixes or removals:
+            await asyncio.to_thread(save_translations, json_path, translations_data)
+
+        activity.logger.info(
+            f"Stages 1-2 complete: {fixes} blocks fixed, {removals} blocks removed"
+        )
+
+        return {
+            "success": True,
+            "fixes": fixes,
+            "removals": removals,
+        }
+
+    except Exception as e:
+        activity.logger.error(f"Stages 1-2 failed: {e}")
+        return {
+            "success": False,
+            "fixes": 0,
+            "removals": 0,
+            "error": str(e),
+        }
+
+
 @activity.defn
 async def gemini_cleanup_activity(
     json_path: str,
@@ -127,22 +176,21 @@ async def gemini_cleanup_activity(
         Dict with corrections count and updated product name
     """
     from src.cleanup import stage3_gemini_cleanup
-    import json
 
     activity.logger.info(f"Stage 3 (Gemini): {json_path}")
     activity.logger.info(f"  Product: {product_name}")
 
     try:
         # Load translations.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            translations_data = json.load(f)
+        translations_data = await asyncio.to_thread(load_translations, json_path)
 
         # Send heartbeat before LLM call (can take 10-30 seconds)
         activity.heartbeat()
 
         # Run Gemini cleanup
-        corrections, corrected_name, tags, error = stage3_gemini_cleanup(
-            translations_data, product_name, product_description
+        # Blocking HTTP request - run it off the event loop so other activities keep going
+        corrections, corrected_name, tags, error = await asyncio.to_thread(
+            stage3_gemini_cleanup, translations_data, product_name, product_description
         )
 
         # Send heartbeat after LLM call
@@ -154,8 +202,7 @@ async def gemini_cleanup_activity(
             activity.logger.info(f"  Applied tags: {tags}")
 
         # Save updated file
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(translations_data, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(save_translations, json_path, translations_data)
 
         activity.logger.info(f"Stage 3 complete: {corrections} corrections")
         if corrected_name:
@@ -1,14 +1,22 @@
 """OCR activities using Document AI."""
 
+import asyncio
+import functools
+import hashlib
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from temporalio import activity
+from google.api_core.exceptions import GoogleAPIError
 from google.cloud import documentai_v1 as documentai
+from google.cloud.documentai_v1.services.document_processor_service.transports import (
+    DocumentProcessorServiceGrpcAsyncIOTransport,
+)
 from google.oauth2 import service_account
 from dotenv import load_dotenv
 
 import re
+import string
 import fitz  # pymupdf
 
 load_dotenv()
@@ -19,9 +27,25 @@ DOCAI_LOCATION = os.getenv("Location", "us")
 DOCAI_PROCESSOR_ID = os.getenv("ProcessorID")
 CREDENTIALS_PATH = os.getenv("CREDENTIALS_PATH")
 
-
+# Blocks that shouldn't be translated, fused into one pattern so each block
+# is a single regex scan (see _should_skip_block). ①-⑳ is a contiguous range.
+_RE_SKIP = re.compile(
+    r"[\d①-⑳]+"  # single numbers, including circled numbers
+    r"|[・•\-●○■□★☆※→←↑↓↔▲▼◆◇]+"  # lone punctuation or symbols
+    r"|[\d①-⑩]+[\.\)）:：]?"  # number with punctuation (e.g. "3.", "①")
+    r"|[©®™]+"  # copyright symbols alone
+    r"|[A-Za-z]"  # single Latin letters
+    r"|[A-Z]{1,4}"  # short all-caps English (labels/abbreviations)
+)
+# Characters a non-digit skip match can start with. Letter matches are at most
+# 4 long, so longer text starting with anything else can't match at all.
+_SKIP_LEAD_CHARS = frozenset("①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳・•-●○■□★☆※→←↑↓↔▲▼◆◇©®™")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+@functools.lru_cache(maxsize=1)
 def get_credentials():
-    """Load Google Cloud credentials."""
+    """Load Google Cloud credentials (parsed once per worker process)."""
     if not CREDENTIALS_PATH:
         raise ValueError(
             "CREDENTIALS_PATH environment variable not set. "
@@ -30,7 +54,44 @@ def get_credentials():
     return service_account.Credentials.from_service_account_file(CREDENTIALS_PATH)
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _get_docai_client() -> documentai.DocumentProcessorServiceAsyncClient:
+    """
+    Shared async Document AI client so the gRPC channel is reused across activities.
+    Must first be called from the worker's event loop, which the channel binds to.
+    """
+    # Talk to the processor's region directly
+    host = f"{DOCAI_LOCATION}-documentai.googleapis.com"
+    channel = DocumentProcessorServiceGrpcAsyncIOTransport.create_channel(
+        host,
+        credentials=get_credentials(),
+        options=[
+            # No message size caps, as the generated transport sets: a batch
+            # response carries page images and tokens, well past gRPC's 4 MB default
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+            # Keep the connection warm between page batches instead of reconnecting
+            # (and redoing TLS) after it goes idle. No gzip: payloads are JPEG/PDF.
+            ("grpc.keepalive_time_ms", 60_000),
+            ("grpc.keepalive_timeout_ms", 20_000),
+        ],
+    )
+    transport = DocumentProcessorServiceGrpcAsyncIOTransport(host=host, channel=channel)
+    return documentai.DocumentProcessorServiceAsyncClient(transport=transport)
+
+
+@functools.lru_cache(maxsize=8)
+def _open_pdf(pdf_path: str, mtime: float) -> fitz.Document:
+    """
+    Open a PDF once per worker and reuse it across page activities.
+    Keyed on mtime so a replaced file is reopened; evicted documents close when
+    garbage collected. Pages are rendered synchronously on the event loop
+    thread, so a document is never used by two renders at once.
+    """
+    return fitz.open(pdf_path)
+
+
+@dataclass(slots=True)
 class TextBlock:
     """A block of text with its position."""
 
@@ -43,7 +104,7 @@ class TextBlock:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Result from Document AI OCR."""
 
@@ -55,7 +116,7 @@ class OCRResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PageOCRResult:
     """Result from OCR on a single page."""
 
@@ -68,10 +129,8 @@ class PageOCRResult:
 @activity.defn
 async def get_pdf_page_count_activity(pdf_path: str) -> int:
     """Get the number of pages in a PDF."""
-    doc = fitz.open(pdf_path)
-    count = len(doc)
-    doc.close()
-    return count
+    # Also warms the document cache for the OCR activities that follow
+    return _open_pdf(pdf_path, os.path.getmtime(pdf_path)).page_count
 
 
 @activity.defn
@@ -83,93 +142,17 @@ async def ocr_page_activity(pdf_path: str, page_num: int) -> PageOCRResult:
     activity.logger.info(f"OCR processing page {page_num} of {pdf_path}")
 
     try:
-        # Render page as PNG
-        doc = fitz.open(pdf_path)
-        page = doc[page_num]
-
-        # Document AI has a 10,000 pixel limit
-        # Calculate DPI to stay under limit while maintaining quality
-        page_width = page.rect.width
-        page_height = page.rect.height
-        max_dimension = max(page_width, page_height)
-
-        # Target 200 DPI for good OCR, but scale down if needed
-        dpi = 200
-        zoom = dpi / 72
-
-        # Check if rendered size would exceed 10k pixels or result in large file
-        rendered_width = page_width * zoom
-        rendered_height = page_height * zoom
-        max_rendered = max(rendered_width, rendered_height)
-
-        # Reduce resolution for large pages to stay under both pixel and file size limits
-        # Target: max 7000 pixels for very large pages to keep JPEG under ~3MB
-        if max_rendered > 9500:
-            # Very large pages need more aggressive scaling
-            zoom = 7000 / max_dimension
-            dpi = zoom * 72
-            activity.logger.info(f"Page {page_num}: Large page detected ({page_width:.0f}x{page_height:.0f}), reducing DPI to {dpi:.0f}")
-
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
-
-        # Get image bytes - use JPEG for large pages to reduce file size
-        # Document AI has ~10-20MB file size limits
-        image_bytes = pix.tobytes("png")
-        mime_type = "image/png"
-
-        # If image is too large, use JPEG compression
-        if len(image_bytes) > 10_000_000:  # 10 MB
-            image_bytes = pix.tobytes("jpeg", jpg_quality=95)
-            mime_type = "image/jpeg"
-            activity.logger.info(f"Page {page_num}: Using JPEG compression ({len(image_bytes) / 1024 / 1024:.1f} MB)")
-
-        doc.close()
+        # Render page image from the worker's cached copy of the PDF
+        doc = _open_pdf(pdf_path, os.path.getmtime(pdf_path))
+        image_bytes, mime_type = _render_page_image(doc[page_num], page_num)
+        # Release MuPDF's cached resources so long-running workers don't grow unbounded
+        fitz.TOOLS.store_shrink(100)
 
         # Send to Document AI
-        credentials = get_credentials()
-        client = documentai.DocumentProcessorServiceClient(credentials=credentials)
-
-        name = f"projects/{PROJECT_ID}/locations/{DOCAI_LOCATION}/processors/{DOCAI_PROCESSOR_ID}"
-
-        raw_document = documentai.RawDocument(
-            content=image_bytes,
-            mime_type=mime_type,
-        )
-
-        request = documentai.ProcessRequest(
-            name=name,
-            raw_document=raw_document,
-        )
+        client = _get_docai_client()
+        document = await _process_content(client, image_bytes, mime_type)
 
-        result = client.process_document(request=request)
-        document = result.document
-
-        # Extract text using blocks from Document AI
-        blocks = []
-        for doc_page in document.pages:
-            for block in doc_page.blocks:
-                vertices = block.layout.bounding_poly.normalized_vertices
-                if len(vertices) >= 4:
-                    x = vertices[0].x
-                    y = vertices[0].y
-                    width = vertices[2].x - vertices[0].x
-                    height = vertices[2].y - vertices[0].y
-
-                    text = _get_text_from_layout(block.layout, document.text)
-
-                    if text.strip() and not _should_skip_block(text):
-                        blocks.append(
-                            TextBlock(
-                                text=text.strip(),
-                                page=page_num,
-                                x=x,
-                                y=y,
-                                width=width,
-                                height=height,
-                                confidence=block.layout.confidence,
-                            )
-                        )
+        blocks = _extract_page_blocks(document, page_num)
 
         activity.logger.info(f"Page {page_num} OCR found {len(blocks)} blocks")
 
@@ -190,6 +173,258 @@ async def ocr_page_activity(pdf_path: str, page_num: int) -> PageOCRResult:
         )
 
 
+@activity.defn
+async def ocr_pages_batch_activity(
+    pdf_path: str, page_nums: list[int], concurrency: int = 10
+) -> list[PageOCRResult]:
+    """
+    OCR several pages from a PDF using Document AI.
+    Sends the pages as one PDF in a single request; if the request fails, renders
+    each page to an image and sends those concurrently, `concurrency` pages at a
+    time. Pages missing from a successful response are re-sent the same way.
+    """
+    activity.logger.info(f"OCR processing pages {page_nums} of {pdf_path}")
+
+    try:
+        doc = _open_pdf(pdf_path, os.path.getmtime(pdf_path))
+        client = _get_docai_client()
+    except Exception as e:
+        # Missing, moved or unreadable PDF - report each page as failed
+        activity.logger.error(f"Pages {page_nums} OCR failed: {e}")
+        return [
+            PageOCRResult(page_num=page_num, blocks=[], success=False, error=str(e))
+            for page_num in page_nums
+        ]
+
+    try:
+        content = _subset_pdf_bytes(doc, page_nums)
+        document = await _process_content(client, content, "application/pdf")
+    except (RuntimeError, GoogleAPIError) as e:
+        # The subset couldn't be built or the request didn't go through (nothing
+        # was processed), so send each page as an image instead
+        activity.logger.warning(
+            f"Pages {page_nums} batch OCR failed, falling back to per-page images: {e}"
+        )
+        by_page = await _ocr_pages_as_images(client, doc, page_nums, concurrency)
+        return [by_page[p] for p in page_nums]
+    activity.heartbeat()
+
+    try:
+        by_page = _pdf_page_results(document, page_nums)
+    except Exception as e:
+        # The pages were already processed (and billed) - don't OCR them again
+        activity.logger.error(f"Pages {page_nums} OCR failed: {e}")
+        return [
+            PageOCRResult(page_num=page_num, blocks=[], success=False, error=str(e))
+            for page_num in page_nums
+        ]
+
+    # Only re-OCR pages missing from the response, one image each
+    missing = [p for p in page_nums if p not in by_page]
+    if missing:
+        activity.logger.warning(
+            f"Batch OCR returned {len(by_page)} of {len(page_nums)} pages, "
+            f"re-OCRing pages {missing} as images"
+        )
+        by_page.update(await _ocr_pages_as_images(client, doc, missing, concurrency))
+    return [by_page[p] for p in page_nums]
+
+
+async def _ocr_pages_as_images(
+    client, doc, page_nums: list[int], concurrency: int
+) -> dict[int, PageOCRResult]:
+    """
+    OCR pages one image per request, `concurrency` requests at a time.
+    Returns results keyed by page number.
+    """
+    # Render all requested pages from the worker's cached copy of the PDF
+    rendered: dict[int, tuple[bytes, str]] = {}
+    errors: dict[int, str] = {}
+    for page_num in page_nums:
+        try:
+            rendered[page_num] = _render_page_image(doc[page_num], page_num)
+        except Exception as e:
+            activity.logger.error(f"Page {page_num} render failed: {e}")
+            errors[page_num] = str(e)
+    fitz.TOOLS.store_shrink(100)
+
+    # Identical pages (blank or boilerplate) only need to be OCR'd once
+    first_with_digest: dict[bytes, int] = {}
+    duplicate_of: dict[int, int] = {}
+    for page_num in page_nums:
+        if page_num not in rendered:
+            continue
+        digest = hashlib.blake2b(rendered[page_num][0], digest_size=16).digest()
+        if digest in first_with_digest:
+            duplicate_of[page_num] = first_with_digest[digest]
+            del rendered[page_num]
+        else:
+            first_with_digest[digest] = page_num
+
+    async def ocr_one(page_num: int) -> PageOCRResult:
+        if page_num in errors:
+            return PageOCRResult(
+                page_num=page_num, blocks=[], success=False, error=errors[page_num]
+            )
+        image_bytes, mime_type = rendered.pop(page_num)
+        try:
+            document = await _process_content(client, image_bytes, mime_type)
+            blocks = _extract_page_blocks(document, page_num)
+            activity.logger.info(f"Page {page_num} OCR found {len(blocks)} blocks")
+            return PageOCRResult(page_num=page_num, blocks=blocks, success=True)
+        except Exception as e:
+            activity.logger.error(f"Page {page_num} OCR failed: {e}")
+            return PageOCRResult(
+                page_num=page_num, blocks=[], success=False, error=str(e)
+            )
+
+    # Send pages in slices of `concurrency` to stay within DocAI quota
+    unique_pages = [p for p in page_nums if p not in duplicate_of]
+    by_page: dict[int, PageOCRResult] = {}
+    for i in range(0, len(unique_pages), concurrency):
+        batch = unique_pages[i : i + concurrency]
+        for result in await asyncio.gather(*[ocr_one(p) for p in batch]):
+            by_page[result.page_num] = result
+        activity.heartbeat()
+
+    # Copy results to duplicate pages, renumbering their blocks
+    for page_num, source_num in duplicate_of.items():
+        source = by_page[source_num]
+        by_page[page_num] = replace(
+            source,
+            page_num=page_num,
+            blocks=[replace(block, page=page_num) for block in source.blocks],
+        )
+        activity.logger.info(f"Page {page_num} is identical to page {source_num}, reused OCR")
+
+    return by_page
+
+
+def _subset_pdf_bytes(doc, page_nums: list[int]) -> bytes:
+    """A PDF of just the given pages, to OCR them with one Document AI request."""
+    with fitz.open() as subset:
+        for page_num in page_nums:
+            subset.insert_pdf(doc, from_page=page_num, to_page=page_num)
+        return subset.tobytes(garbage=3, deflate=True)
+
+
+def _pdf_page_results(document, page_nums: list[int]) -> dict[int, PageOCRResult]:
+    """Map the pages of a subset-PDF response back to their original page numbers."""
+    full_text = document.text
+    results = {}
+    for index, doc_page in enumerate(document.pages):
+        # page_number is 1-based within the subset; fall back to response order
+        position = doc_page.page_number - 1 if doc_page.page_number else index
+        if not 0 <= position < len(page_nums):
+            continue
+        page_num = page_nums[position]
+        blocks = _extract_blocks(doc_page, full_text, page_num)
+        activity.logger.info(f"Page {page_num} OCR found {len(blocks)} blocks")
+        results[page_num] = PageOCRResult(page_num=page_num, blocks=blocks, success=True)
+    return results
+
+
+def _render_page_image(page, page_num: int) -> tuple[bytes, str]:
+    """Render a PDF page to image bytes sized for Document AI. Returns (bytes, mime_type)."""
+    # Document AI has a 10,000 pixel limit
+    # Calculate DPI to stay under limit while maintaining quality
+    page_width = page.rect.width
+    page_height = page.rect.height
+    max_dimension = max(page_width, page_height)
+
+    # Target ~2400 pixels on the long side: 200 DPI for A4 and smaller, down to
+    # 150 DPI for larger pages, where that is still plenty for OCR
+    dpi = max(150, min(200, int(2400 * 72 / max_dimension)))
+    zoom = dpi / 72
+
+    # Check if rendered size would exceed 10k pixels or result in large file
+    rendered_width = page_width * zoom
+    rendered_height = page_height * zoom
+    max_rendered = max(rendered_width, rendered_height)
+
+    # Reduce resolution for large pages to stay under both pixel and file size limits
+    # Target: max 7000 pixels for very large pages to keep JPEG under ~3MB
+    if max_rendered > 9500:
+        # Very large pages need more aggressive scaling
+        zoom = 7000 / max_dimension
+        dpi = zoom * 72
+        activity.logger.info(f"Page {page_num}: Large page detected ({page_width:.0f}x{page_height:.0f}), reducing DPI to {dpi:.0f}")
+
+    # Pages with no embedded images are text and line art - render them in
+    # grayscale, which is a third of the pixel data to rasterize and encode
+    colorspace = fitz.csRGB if page.get_images() else fitz.csGRAY
+
+    mat = fitz.Matrix(zoom, zoom)
+    pix = page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False)
+
+    # JPEG encodes much faster than PNG and keeps uploads well under Document AI's
+    # ~10-20MB file size limits; quality 85 is plenty for OCR
+    image_bytes = pix.tobytes("jpeg", jpg_quality=85)
+    mime_type = "image/jpeg"
+
+    return image_bytes, mime_type
+
+
+async def _process_content(client, content: bytes, mime_type: str):
+    """Send a page image or PDF to Document AI and return the parsed document."""
+    name = f"projects/{PROJECT_ID}/locations/{DOCAI_LOCATION}/processors/{DOCAI_PROCESSOR_ID}"
+
+    raw_document = documentai.RawDocument(
+        content=content,
+        mime_type=mime_type,
+    )
+
+    request = documentai.ProcessRequest(
+        name=name,
+        raw_document=raw_document,
+    )
+
+    result = await client.process_document(request=request)
+    return result.document
+
+
+def _extract_page_blocks(document, page_num: int) -> list[TextBlock]:
+    """Extract text blocks from a single-page Document AI result."""
+    # document.text copies the whole string, so fetch it once
+    full_text = document.text
+    blocks = []
+    for doc_page in document.pages:
+        blocks.extend(_extract_blocks(doc_page, full_text, page_num))
+    return blocks
+
+
+def _extract_blocks(doc_page, full_text: str, page_num: int) -> list[TextBlock]:
+    """Extract text blocks from one Document AI page."""
+    blocks = []
+    # Each proto attribute access crosses into the protobuf layer, so read the
+    # layout and corner coordinates once per block
+    for block in doc_page.blocks:
+        layout = block.layout
+        vertices = layout.bounding_poly.normalized_vertices
+        if len(vertices) < 4:
+            continue
+
+        # Skip empty and noise blocks before touching the rest of the layout
+        text = _get_text_from_layout(layout, full_text).strip()
+        if not text or _should_skip_block(text):
+            continue
+
+        top_left, bottom_right = vertices[0], vertices[2]
+        x, y = top_left.x, top_left.y
+        blocks.append(
+            TextBlock(
+                text=text,
+                page=page_num,
+                x=x,
+                y=y,
+                width=bottom_right.x - x,
+                height=bottom_right.y - y,
+                confidence=layout.confidence,
+            )
+        )
+    return blocks
+
+
 @activity.defn
 async def ocr_document_activity(pdf_path: str) -> OCRResult:
     """
@@ -198,8 +433,7 @@ async def ocr_document_activity(pdf_path: str) -> OCRResult:
     activity.logger.info(f"OCR processing: {pdf_path}")
 
     try:
-        credentials = get_credentials()
-        client = documentai.DocumentProcessorServiceClient(credentials=credentials)
+        client = _get_docai_client()
 
         # Read PDF
         with open(pdf_path, "rb") as f:
@@ -218,37 +452,16 @@ async def ocr_document_activity(pdf_path: str) -> OCRResult:
             raw_document=raw_document,
         )
 
-        result = client.process_document(request=request)
+        result = await client.process_document(request=request)
         document = result.document
 
         # Extract text blocks with positions
-        blocks = []
-        for page_idx, page in enumerate(document.pages):
-            for block in page.blocks:
-                # Get bounding box (normalized coordinates)
-                vertices = block.layout.bounding_poly.normalized_vertices
-                if len(vertices) >= 4:
-                    x = vertices[0].x
-                    y = vertices[0].y
-                    width = vertices[2].x - vertices[0].x
-                    height = vertices[2].y - vertices[0].y
-
-                    # Extract text for this block
-                    text = _get_text_from_layout(block.layout, document.text)
-
-                    # Skip blocks that shouldn't be translated (single numbers, symbols, etc.)
-                    if text.strip() and not _should_skip_block(text):
-                        blocks.append(
-                            TextBlock(
-                                text=text.strip(),
-                                page=page_idx,
-                                x=x,
-                                y=y,
-                                width=width,
-                                height=height,
-                                confidence=block.layout.confidence,
-                            )
-                        )
+        full_text = document.text
+        blocks = [
+            block
+            for page_idx, page in enumerate(document.pages)
+            for block in _extract_blocks(page, full_text, page_idx)
+        ]
 
         activity.logger.info(f"OCR complete: {len(blocks)} blocks found")
 
@@ -256,7 +469,7 @@ async def ocr_document_activity(pdf_path: str) -> OCRResult:
             pdf_path=pdf_path,
             pages=len(document.pages),
             blocks=blocks,
-            full_text=document.text,
+            full_text=full_text,
             success=True,
         )
 
@@ -274,47 +487,37 @@ async def ocr_document_activity(pdf_path: str) -> OCRResult:
 
 def _get_text_from_layout(layout, full_text: str) -> str:
     """Extract text from a layout element using text anchors."""
-    text = ""
-    for segment in layout.text_anchor.text_segments:
-        start = int(segment.start_index) if segment.start_index else 0
-        end = int(segment.end_index)
-        text += full_text[start:end]
-    return text
+    # Read each segment's offsets out of the proto once
+    bounds = [
+        (int(segment.start_index or 0), int(segment.end_index))
+        for segment in layout.text_anchor.text_segments
+    ]
+    if not bounds:
+        return ""
+
+    # Usually one segment, or several that follow each other: one slice
+    if all(end == next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:])):
+        return full_text[bounds[0][0] : bounds[-1][1]]
+    return "".join(full_text[start:end] for start, end in bounds)
 
 
 def _should_skip_block(text: str) -> bool:
     """
     Determine if a text block should be skipped (not translated).
     Skip: single numbers, lone symbols, single letters, short all-caps English.
+    Expects text that is already stripped (_extract_blocks strips it once).
     """
-    text = text.strip()
-
     # Skip empty
     if not text:
         return True
 
-    # Skip single numbers (including circled numbers like ①②③)
-    if re.match(r"^[\d①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]+$", text):
-        return True
-
-    # Skip lone punctuation or symbols
-    if re.match(r"^[・•\-●○■□★☆※→←↑↓↔▲▼◆◇]+$", text):
-        return True
-
-    # Skip very short text that's just a number with punctuation (e.g., "3.", "①")
-    if re.match(r"^[\d①②③④⑤⑥⑦⑧⑨⑩]+[\.\)）:：]?$", text):
-        return True
-
-    # Skip copyright symbols alone
-    if re.match(r"^[©®™]+$", text):
-        return True
-
-    # Skip single Latin letters (A-Z, a-z)
-    if re.match(r"^[A-Za-z]$", text):
-        return True
-
-    # Skip short all-caps English words (1-4 chars) - likely labels/abbreviations
-    if re.match(r"^[A-Z]{1,4}$", text):
-        return True
+    # Fast path for ordinary sentences, which fail every pattern
+    first = text[0]
+    if not (
+        first.isdigit()
+        or first in _SKIP_LEAD_CHARS
+        or (len(text) <= 4 and first in _ASCII_LETTERS)
+    ):
+        return False
 
-    return False
+    return _RE_SKIP.fullmatch(text) is not None
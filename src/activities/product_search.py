@@ -1,7 +1,45 @@
 """Product search activities for Tokullectibles."""
 
+import asyncio
+import time
+import unicodedata
+
 from temporalio import activity
-from src.tokullectibles import search_tokullectibles
+from src.tokullectibles import ProductInfo, search_tokullectibles
+
+# Search results per normalized product name: key -> (expires_at, result).
+# Misses expire quickly so a product added to the store shows up soon.
+_SEARCH_CACHE: dict[str, tuple[float, ProductInfo | None]] = {}
+_SEARCH_CACHE_SIZE = 1024
+_FOUND_TTL = 3600
+_NOT_FOUND_TTL = 60
+
+
+async def _cached_search(product_name: str) -> ProductInfo | None:
+    """search_tokullectibles with a per-worker TTL cache."""
+    key = unicodedata.normalize("NFKC", product_name).strip().casefold()
+    now = time.monotonic()
+
+    cached = _SEARCH_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        activity.logger.info(f"Using cached search result for: {product_name}")
+        return cached[1]
+
+    # Blocking HTTP requests - keep them off the event loop
+    result = await asyncio.to_thread(search_tokullectibles, product_name)
+
+    # Drop expired entries, then the oldest ones, to stay bounded
+    _SEARCH_CACHE.pop(key, None)
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_SIZE:
+        expired = [k for k, (expires_at, _) in _SEARCH_CACHE.items() if expires_at <= now]
+        for k in expired:
+            del _SEARCH_CACHE[k]
+        while len(_SEARCH_CACHE) >= _SEARCH_CACHE_SIZE:
+            del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+
+    ttl = _FOUND_TTL if result else _NOT_FOUND_TTL
+    _SEARCH_CACHE[key] = (now + ttl, result)
+    return result
 
 
 @activity.defn
@@ -19,7 +57,7 @@ async def search_product_url_activity(product_name: str) -> dict:
     activity.logger.info(f"Searching Tokullectibles for: {product_name}")
 
     try:
-        result = search_tokullectibles(product_name)
+        result = await _cached_search(product_name)
 
         if result:
             activity.logger.info(f"Found product: {result.name} at {result.url}")
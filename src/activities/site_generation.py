@@ -1,23 +1,47 @@
 """Site generation activities for creating static HTML viewers."""
 
+import asyncio
+import functools
+import html
+import math
+import multiprocessing
 import os
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from temporalio import activity
 from dotenv import load_dotenv
 
 import re
-import json
 import fitz  # pymupdf
+import orjson
 from PIL import Image, ImageDraw, ImageFont
-import io
 
+from src.activities._io import save_translations
 from src.html_template import generate_manual_viewer_html, generate_main_index_html
 from src.tagging import get_tag_definitions
 
 load_dotenv()
 
+# Longest side of a rendered page image, in pixels (A4 at 150 DPI is 1754)
+MAX_PAGE_PIXELS = 4096
+
+# Fraction of overlay text blocks that may fail to draw before the raster
+# overlay PDF is treated as broken (e.g. an unusable font) rather than patchy
+MAX_DRAW_FAILURE_RATE = 0.1
+
+# List markers used when wrapping overlay text (①-⑩ is a contiguous range)
+_NUMBERED_RE = re.compile(r"^(\d+[\.\)]\s*|[①-⑩]\s*|\(\d+\)\s*)")
+_BULLET_RE = re.compile(r"^([・•\-●○■□★☆※]\s*)")
+_SPLIT_RE = re.compile(
+    r"(?:^|(?<=\s))(\d+[\.\)]\s*|[①-⑩]\s*|\(\d+\)\s*|[・•●○■□★☆※]\s*)"
+)
+
 
 @dataclass
 class SiteOutput:
@@ -48,86 +72,104 @@ async def create_overlay_pdf_activity(
     )
 
     try:
-        doc = fitz.open(original_pdf)
-        output_doc = fitz.open()
-
-        # Group blocks by page
-        blocks_by_page: dict[int, list[dict]] = {}
-        for block in translated_blocks:
-            page_num = block["page"]
-            if page_num not in blocks_by_page:
-                blocks_by_page[page_num] = []
-            blocks_by_page[page_num].append(block)
+        # Group blocks by page as flat (x, y, width, height, translated) tuples,
+        # so the per-page loop doesn't repeat dict lookups for every field.
+        # Blocks keep their OCR order within a page.
+        blocks_by_page: dict[int, list[tuple]] = defaultdict(list)
+        for b in translated_blocks:
+            blocks_by_page[b["page"]].append(
+                (b["x"], b["y"], b["width"], b["height"], b["translated"])
+            )
 
-        # Process each page
         dpi = 150  # Balance between quality and size
         zoom = dpi / 72
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-
-            # Render page to image
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to PIL Image
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            draw = ImageDraw.Draw(img)
-
-            img_width, img_height = img.size
-
-            # Draw overlays for this page
-            if page_num in blocks_by_page:
-                for block in blocks_by_page[page_num]:
-                    # Convert normalized coords to pixel coords
-                    x = int(block["x"] * img_width)
-                    y = int(block["y"] * img_height)
-                    width = int(block["width"] * img_width)
-                    height = int(block["height"] * img_height)
-
-                    # Skip very small blocks
-                    if width < 10 or height < 10:
-                        continue
-
-                    # Draw semi-transparent white background (85% opacity = 217/255)
-                    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-                    overlay_draw = ImageDraw.Draw(overlay)
-                    overlay_draw.rectangle(
+        drawn = 0
+        draw_failures = 0
+
+        # Context managers close both documents even if a page fails
+        with fitz.open(original_pdf) as doc, fitz.open() as output_doc:
+            # Process each page
+            for page_num in range(len(doc)):
+                page = doc[page_num]
+
+                # Render page to image
+                page_zoom = _capped_zoom(page, zoom)
+                mat = fitz.Matrix(page_zoom, page_zoom)
+                pix = page.get_pixmap(matrix=mat)
+
+                img_width, img_height = pix.width, pix.height
+
+                # Convert normalized coords to pixel coords, skipping very small
+                # blocks and ones with no translation to draw
+                page_boxes = [
+                    (int(bx * img_width), int(by * img_height), width, height, text)
+                    for bx, by, bw, bh, text in blocks_by_page.get(page_num, ())
+                    if text.strip()
+                    and (width := int(bw * img_width)) >= 10
+                    and (height := int(bh * img_height)) >= 10
+                ]
+
+                # Create PDF page with the original page dimensions
+                pdf_page = output_doc.new_page(width=page.rect.width, height=page.rect.height)
+
+                if not page_boxes:
+                    # Nothing to draw - insert the rendered pixmap as-is, no PIL round-trip
+                    pdf_page.insert_image(pdf_page.rect, pixmap=pix)
+                    pix = None
+                    continue
+
+                # Convert to PIL Image straight from the raw samples (no PNG round-trip)
+                img = Image.frombytes("RGB", (img_width, img_height), pix.samples)
+                pix = None
+                # "RGBA" draw mode alpha-blends fills onto the RGB page in place
+                draw = ImageDraw.Draw(img, "RGBA")
+
+                # Semi-transparent white backgrounds (85% opacity = 217/255), blended
+                # straight onto the page - no full-page overlay or RGBA copy
+                for x, y, width, height, _ in page_boxes:
+                    draw.rectangle(
                         [x, y, x + width, y + height],
                         fill=(255, 255, 255, 217),  # 85% opacity
                     )
-                    img = Image.alpha_composite(img.convert("RGBA"), overlay)
-                    draw = ImageDraw.Draw(img)
 
+                for x, y, width, height, text in page_boxes:
                     # Calculate font size - minimum 10 for readability
                     fontsize = max(10, min(14, int(height * 0.5)))
 
                     # Draw text with word wrapping
-                    text = block["translated"]
                     font = _get_font(fontsize)
-                    _draw_wrapped_text(
+                    drawn += 1
+                    if not _draw_wrapped_text(
                         draw, text, x + 2, y + 2, width - 4, height - 4, font, fontsize
+                    ):
+                        draw_failures += 1
+
+                # Convert back to a raw pixmap (no PNG encode/decode)
+                page_pix = fitz.Pixmap(fitz.csRGB, img_width, img_height, img.tobytes(), 0)
+                pdf_page.insert_image(pdf_page.rect, pixmap=page_pix)
+
+                # Drop this page's buffers now rather than whenever GC gets to them
+                page_pix = None
+                img.close()
+                img = draw = None
+
+            if draw_failures:
+                activity.logger.warning(
+                    f"Failed to draw {draw_failures} of {drawn} text blocks"
+                )
+                if draw_failures > drawn * MAX_DRAW_FAILURE_RATE:
+                    raise RuntimeError(
+                        f"{draw_failures} of {drawn} text blocks failed to draw"
                     )
 
-            # Convert back to PDF page
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format="PNG")
-            img_bytes.seek(0)
+            # Save output
+            output_dir = Path(output_path).parent
+            output_dir.mkdir(exist_ok=True)
+            output_doc.save(output_path)
 
-            # Create new page with image
-            img_doc = fitz.open(stream=img_bytes.read(), filetype="png")
-            rect = img_doc[0].rect
-
-            # Create PDF page with same dimensions
-            pdf_page = output_doc.new_page(width=rect.width, height=rect.height)
-            pdf_page.insert_image(rect, stream=img_bytes.getvalue())
-
-        # Save output
-        output_dir = Path(output_path).parent
-        output_dir.mkdir(exist_ok=True)
-        output_doc.save(output_path)
-        output_doc.close()
-        doc.close()
+        # Release MuPDF's cached resources so long-running workers don't grow unbounded
+        fitz.TOOLS.store_shrink(100)
 
         activity.logger.info(f"Overlay PDF created: {output_path}")
         return output_path
@@ -137,6 +179,83 @@ async def create_overlay_pdf_activity(
         raise
 
 
+@activity.defn
+async def create_vector_overlay_pdf_activity(
+    original_pdf: str,
+    translated_blocks: list[dict],
+    output_path: str,
+) -> str:
+    """
+    Create a PDF with translated text overlaid on the original.
+    Draws the overlays as vector graphics on the original pages - no rasterizing,
+    so the output stays small and the text stays searchable.
+    """
+    activity.logger.info(
+        f"Creating vector overlay PDF: {output_path} with {len(translated_blocks)} blocks"
+    )
+
+    try:
+        with fitz.open(original_pdf) as doc:
+            for block in translated_blocks:
+                # Nothing to overlay - leave the original text visible
+                if not block["translated"].strip():
+                    continue
+
+                page = doc[block["page"]]
+                page_width, page_height = page.rect.width, page.rect.height
+
+                # Convert normalized coords to page coords
+                rect = fitz.Rect(
+                    block["x"] * page_width,
+                    block["y"] * page_height,
+                    (block["x"] + block["width"]) * page_width,
+                    (block["y"] + block["height"]) * page_height,
+                )
+
+                # Skip very small blocks (same cutoff as 10px at 150 DPI)
+                if rect.width < 5 or rect.height < 5:
+                    continue
+
+                # Semi-transparent white background (85% opacity)
+                page.draw_rect(rect, color=None, fill=(1, 1, 1), fill_opacity=0.85)
+
+                text_rect = rect + (1, 1, -1, -1)
+                text = block["translated"]
+                if _pdf_font_covers(text):
+                    # insert_textbox writes nothing if the text doesn't fit, so
+                    # shrink the font until it does
+                    fontsize = max(6, min(11, rect.height * 0.5))
+                    while fontsize >= 4:
+                        if page.insert_textbox(
+                            text_rect, text, fontsize=fontsize, **_pdf_font_args()
+                        ) >= 0:
+                            break
+                        fontsize -= 0.5
+                    else:
+                        # Still too long - let the HTML layout scale it down to fit
+                        page.insert_htmlbox(text_rect, html.escape(text))
+                else:
+                    # Characters the overlay font lacks (e.g. CJK) - the HTML
+                    # layout falls back to MuPDF's built-in fonts for them
+                    page.insert_htmlbox(text_rect, html.escape(text))
+
+            # Only embed the glyphs that were used, not the whole font file
+            doc.subset_fonts()
+
+            # Save output
+            output_dir = Path(output_path).parent
+            output_dir.mkdir(exist_ok=True)
+            doc.save(output_path, garbage=3, deflate=True)
+        fitz.TOOLS.store_shrink(100)
+
+        activity.logger.info(f"Vector overlay PDF created: {output_path}")
+        return output_path
+
+    except Exception as e:
+        activity.logger.error(f"Failed to create vector overlay PDF: {e}")
+        raise
+
+
 @activity.defn
 async def generate_site_activity(
     original_pdf: str,
@@ -161,39 +280,48 @@ async def generate_site_activity(
         pages_dir = output_path / "pages"
         pages_dir.mkdir(parents=True, exist_ok=True)
 
-        doc = fitz.open(original_pdf)
-        page_count = len(doc)
+        with fitz.open(original_pdf) as doc:
+            page_count = len(doc)
 
-        # Group blocks by page
-        blocks_by_page: dict[int, list[dict]] = {}
-        for idx, block in enumerate(translated_blocks):
-            page_num = block["page"]
-            if page_num not in blocks_by_page:
-                blocks_by_page[page_num] = []
-            # Add block ID for referencing in JSON
-            block_with_id = {**block, "id": f"b{idx}"}
-            blocks_by_page[page_num].append(block_with_id)
+        # Group blocks by page in one pass (keeps OCR order within a page)
+        blocks_by_page: dict[int, list[dict]] = defaultdict(list)
+        for block in translated_blocks:
+            blocks_by_page[block["page"]].append(block)
 
-        # Render page images
+        # Render page images in parallel - rasterizing and WebP encoding are
+        # CPU-bound, so spread pages across processes
         dpi = 150
         zoom = dpi / 72
+        loop = asyncio.get_running_loop()
+        pool = _get_render_pool()
+        futures = [
+            loop.run_in_executor(
+                pool,
+                _render_page_webp,
+                original_pdf,
+                page_num,
+                zoom,
+                str(pages_dir / f"page-{page_num}.webp"),
+            )
+            for page_num in range(page_count)
+        ]
+        try:
+            # Send heartbeat every 5 pages to keep Temporal informed
+            for done, future in enumerate(asyncio.as_completed(futures), start=1):
+                await future
+                if done % 5 == 0:
+                    activity.heartbeat()
+        except BaseException as e:
+            # Don't leave this manual's remaining pages queued in the shared pool
+            for future in futures:
+                future.cancel()
+            if isinstance(e, BrokenProcessPool):
+                await _retire_render_pool(pool)
+            raise
+
+        # Build page data for JSON with nested bounds structure
         pages_data = []
-
         for page_num in range(page_count):
-            # Send heartbeat every 5 pages to keep Temporal informed
-            if page_num % 5 == 0:
-                activity.heartbeat()
-
-            page = doc[page_num]
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Save as WebP
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            img_path = pages_dir / f"page-{page_num}.webp"
-            img.save(img_path, "WEBP", quality=85)
-
-            # Build page data for JSON with nested bounds structure
             page_blocks = blocks_by_page.get(page_num, [])
             pages_data.append(
                 {
@@ -214,8 +342,6 @@ async def generate_site_activity(
                 }
             )
 
-        doc.close()
-
         # Tags will be generated by Gemini cleanup with full manual context
         # This provides more accurate tagging than just the product name
         manual_name = output_path.name
@@ -239,8 +365,7 @@ async def generate_site_activity(
             "pages": pages_data,
         }
         json_path = output_path / "translations.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
+        save_translations(json_path, json_data)
 
         # Regenerate main index for all manuals
         # manuals are in manuals/, meta.json goes to web/
@@ -276,6 +401,60 @@ async def generate_site_activity(
         )
 
 
+# Long-lived pool for page rendering, created on first use. Workers come from
+# forkserver (spawn where unavailable) rather than fork: forking the
+# multithreaded worker process (gRPC, Temporal core) can deadlock the child.
+_RENDER_POOL: ProcessPoolExecutor | None = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Get the shared page rendering pool, creating it if needed."""
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        start_method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        _RENDER_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(start_method)
+        )
+    return _RENDER_POOL
+
+
+async def _retire_render_pool(pool: ProcessPoolExecutor):
+    """Replace a broken rendering pool; shut it down without blocking the event loop."""
+    global _RENDER_POOL
+    if _RENDER_POOL is pool:
+        _RENDER_POOL = None
+    await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
+def _render_page_webp(pdf_path: str, page_num: int, zoom: float, out_path: str):
+    """Render one page to WebP. Runs in a worker process, so opens its own document."""
+    try:
+        with fitz.open(pdf_path) as doc:
+            page = doc[page_num]
+            zoom = _capped_zoom(page, zoom)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        with Image.frombytes("RGB", (pix.width, pix.height), pix.samples) as img:
+            pix = None
+            # method=2 encodes ~2x faster than the default (4) for a ~2% larger file;
+            # method=0 is faster again but ~25% larger than 2
+            img.save(out_path, "WEBP", quality=85, method=2)
+    finally:
+        # Pool processes are reused across pages, so don't let MuPDF's store pile up
+        fitz.TOOLS.store_shrink(100)
+
+
+def _capped_zoom(page, zoom: float) -> float:
+    """
+    Limit zoom so the rendered page's long side stays within MAX_PAGE_PIXELS.
+    A4/Letter at 150 DPI are well under it; poster-size sheets would otherwise
+    need hundreds of MB per pixmap.
+    """
+    long_side = max(page.rect.width, page.rect.height)
+    return min(zoom, MAX_PAGE_PIXELS / long_side)
+
+
 def _generate_main_index(output_root: Path):
     """Generate meta.json containing all site metadata (manuals list, tags, sitemap data).
 
@@ -286,33 +465,28 @@ def _generate_main_index(output_root: Path):
     # Get centralized tag definitions from tagging module
     tag_definitions = get_tag_definitions()
 
-    # Scan output directory for manual folders
-    for folder in sorted(output_root.iterdir()):
-        if not folder.is_dir():
-            continue
+    # Scan output directory for manual folders (scandir reuses the d_type from
+    # the directory listing instead of stat-ing every entry)
+    with os.scandir(output_root) as entries:
+        folders = sorted(
+            (Path(entry.path) for entry in entries if entry.is_dir()),
+            key=lambda folder: folder.name,
+        )
 
-        # Check if it has translations.json
+    for folder in folders:
         json_path = folder / "translations.json"
-        if not json_path.exists():
-            continue
 
-        # Read metadata
+        # Read metadata (skip folders without translations.json)
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            meta = data.get("meta", {})
-            pages = data.get("pages", [])
-
-            # Get first page image for thumbnail
-            thumbnail = pages[0]["image"] if pages else "pages/page-0.webp"
+            stat = json_path.stat()
+            meta = _cached_manual_meta(str(json_path), stat.st_mtime_ns, stat.st_size)
 
             manual_info = {
                 "name": folder.name,
                 "source": meta.get("source", folder.name),
-                "pages": len(pages),
-                "blocks": sum(len(p.get("blocks", [])) for p in pages),
-                "thumbnail": f"{folder.name}/{thumbnail}",
+                "pages": meta["pages"],
+                "blocks": meta["blocks"],
+                "thumbnail": f"{folder.name}/{meta['thumbnail']}",
                 "source_url": meta.get("source_url", ""),
                 "blog_url": meta.get("blog_url", ""),
             }
@@ -322,6 +496,8 @@ def _generate_main_index(output_root: Path):
                 manual_info["tags"] = meta["tags"]
 
             manuals.append(manual_info)
+        except FileNotFoundError:
+            continue
         except Exception as e:
             print(f"Warning: Could not read {json_path}: {e}")
             continue
@@ -341,14 +517,42 @@ def _generate_main_index(output_root: Path):
     web_path = Path("web")
     web_path.mkdir(exist_ok=True)
     meta_path = web_path / "meta.json"
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta_data, f, ensure_ascii=False, indent=2)
+    meta_path.write_bytes(
+        orjson.dumps(meta_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
 
     print(
         f"Updated web/meta.json with {len(manuals)} manual(s), {len(tag_definitions)} tag type(s)"
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_manual_meta(json_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    _read_manual_meta, cached per file version (mtime and size). The worker
+    regenerates the index after every manual, so only the folders that changed
+    get re-read and recounted.
+    """
+    return _read_manual_meta(Path(json_path))
+
+
+def _read_manual_meta(json_path: Path) -> dict:
+    """
+    Read the meta object of a translations.json, with the page and block counts
+    and thumbnail taken from its pages. The counts stored in meta are only kept
+    current by some writers, so they're recounted rather than trusted.
+    """
+    data = orjson.loads(json_path.read_bytes())
+    pages = data.get("pages", [])
+    return {
+        **data.get("meta", {}),
+        "pages": len(pages),
+        "blocks": sum(len(p.get("blocks", [])) for p in pages),
+        # Get first page image for thumbnail
+        "thumbnail": pages[0]["image"] if pages else "pages/page-0.webp",
+    }
+
+
 def _generate_html_viewer(data: dict) -> str:
     """Generate an interactive HTML viewer using external template."""
     title = data.get("meta", {}).get("source", "Translated Document")
@@ -356,21 +560,69 @@ def _generate_html_viewer(data: dict) -> str:
     return generate_manual_viewer_html(title, source_url)
 
 
-def _get_font(size: int):
-    """Get a font at the given size, trying several options."""
-    # Try Arial first (usually available on macOS)
-    font_paths = [
-        "/System/Library/Fonts/Supplemental/Arial.ttf",
-        "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
-        "/Library/Fonts/Arial.ttf",
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    ]
-    for path in font_paths:
+# Overlay font candidates, Arial first (usually available on macOS)
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+
+
+def _probe_font_path() -> str | None:
+    """Return the first candidate font file that loads, or None."""
+    for path in _FONT_CANDIDATES:
         try:
-            return ImageFont.truetype(path, size)
-        except Exception:
+            ImageFont.truetype(path, 12)
+        except OSError:
             continue
-    return ImageFont.load_default()
+        return path
+    return None
+
+
+# Probed once at import so _get_font never retries missing files
+_FONT_PATH = _probe_font_path()
+
+# Wrapped layouts for recurring strings (headers, footers, warnings), keyed by
+# (text, max_width, max_height, fontsize) -> (final fontsize, lines)
+_LAYOUT_CACHE: OrderedDict = OrderedDict()
+_LAYOUT_CACHE_SIZE = 2048
+
+
+def _pdf_font_args() -> dict:
+    """insert_textbox font arguments: the overlay TTF if found, else base-14 Helvetica."""
+    if _FONT_PATH is None:
+        return {"fontname": "helv"}
+    return {"fontname": "overlay", "fontfile": _FONT_PATH}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_font() -> fitz.Font:
+    """The overlay TTF as a PyMuPDF font, for glyph coverage checks."""
+    return fitz.Font(fontfile=_FONT_PATH)
+
+
+def _pdf_font_covers(text: str) -> bool:
+    """Whether the vector overlay font has a glyph for every character in text."""
+    if _FONT_PATH is None:
+        # Base-14 Helvetica only encodes Latin-1
+        return all(ord(char) < 256 for char in text)
+    font = _get_pdf_font()
+    return all(char.isspace() or font.has_glyph(ord(char)) for char in text)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_font(size: int):
+    """Get the overlay font at the given size (cached per size)."""
+    if _FONT_PATH is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(_FONT_PATH, size)
+
+
+@functools.lru_cache(maxsize=16384)
+def _text_width(font, text: str) -> float:
+    """Advance width of text in font, cached across blocks and pages."""
+    return font.getlength(text)
 
 
 def _detect_list_item(text: str) -> tuple[str, str]:
@@ -379,12 +631,12 @@ def _detect_list_item(text: str) -> tuple[str, str]:
     Returns (marker, rest_of_text) or ("", text) if no marker.
     """
     # Numbered lists: 1. 2. ① ② (1) etc.
-    numbered = re.match(r"^(\d+[\.\)]\s*|[①②③④⑤⑥⑦⑧⑨⑩]\s*|\(\d+\)\s*)", text)
+    numbered = _NUMBERED_RE.match(text)
     if numbered:
         return numbered.group(), text[numbered.end() :]
 
     # Bullet points: ・ • - ● ○ ■ □ ★ ☆ ※
-    bullet = re.match(r"^([・•\-●○■□★☆※]\s*)", text)
+    bullet = _BULLET_RE.match(text)
     if bullet:
         return bullet.group(), text[bullet.end() :]
 
@@ -396,12 +648,9 @@ def _split_list_items(text: str) -> list[str]:
     Split text that contains multiple list items into separate items.
     e.g., "1. First 2. Second" -> ["1. First", "2. Second"]
     """
-    # Pattern to find list markers that appear mid-text
-    # Match: space or start, then number+dot/paren, or bullet characters
-    pattern = r"(?:^|(?<=\s))(\d+[\.\)]\s*|[①②③④⑤⑥⑦⑧⑨⑩]\s*|\(\d+\)\s*|[・•●○■□★☆※]\s*)"
-
-    # Find all matches with positions
-    matches = list(re.finditer(pattern, text))
+    # Find list markers that appear mid-text (see _SPLIT_RE):
+    # space or start, then number+dot/paren, or bullet characters
+    matches = list(_SPLIT_RE.finditer(text))
 
     if len(matches) <= 1:
         return [text]
@@ -422,43 +671,40 @@ def _split_list_items(text: str) -> list[str]:
     return items if items else [text]
 
 
-def _draw_wrapped_text(
-    draw,
-    text: str,
-    x: int,
-    y: int,
-    max_width: int,
-    max_height: int,
-    font,
-    fontsize: int,
-):
-    """Draw text with word wrapping, auto-shrinking font if needed."""
+def _wrap_items(
+    items: list[tuple[str, list[str]]], font, max_width: int, fontsize: int
+) -> list[tuple[str, int]]:
+    """
+    Wrap (marker, words) list items to max_width, each item on its own lines.
+    Returns (line_text, indent) pairs. fontsize only sizes the fallback measure.
+    """
 
-    def get_text_width(txt, fnt):
-        """Get width of text using getbbox."""
+    def get_text_width(txt):
+        """Get advance width of text (no glyph bbox needed)."""
         try:
-            bbox = fnt.getbbox(txt)
-            return bbox[2] - bbox[0] if bbox else len(txt) * fontsize // 2
+            return _text_width(font, txt)
         except Exception:
             return len(txt) * fontsize // 2
 
-    def wrap_single_item(txt, fnt, mw):
-        """Wrap a single text item (possibly with list marker)."""
-        marker, content = _detect_list_item(txt)
-        indent = get_text_width(marker, fnt) if marker else 0
+    # Measure each word once and keep a running line width, rather than
+    # re-measuring the whole candidate line for every word
+    space_width = get_text_width(" ")
 
-        words = content.split()
-        lines = []
+    lines = []
+    for marker, words in items:
+        indent = get_text_width(marker) if marker else 0
         current_line = []
+        current_width = 0.0
         first_line = True
 
         for word in words:
-            test_line = " ".join(current_line + [word])
-            effective_width = mw if first_line else mw - indent
-            line_width = get_text_width(test_line, fnt)
+            word_width = get_text_width(word)
+            effective_width = max_width if first_line else max_width - indent
+            line_width = current_width + space_width + word_width if current_line else word_width
 
             if line_width <= effective_width:
                 current_line.append(word)
+                current_width = line_width
             else:
                 if current_line:
                     if first_line and marker:
@@ -467,6 +713,7 @@ def _draw_wrapped_text(
                     else:
                         lines.append((" ".join(current_line), indent if marker else 0))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             if first_line and marker:
@@ -474,42 +721,99 @@ def _draw_wrapped_text(
             else:
                 lines.append((" ".join(current_line), indent if marker else 0))
 
-        return lines
+    return lines
 
-    def wrap_text_with_lists(txt, fnt, mw):
-        """Wrap text, splitting multiple list items onto separate lines."""
-        # First split into separate list items
-        items = _split_list_items(txt)
 
-        all_lines = []
-        for item in items:
-            item_lines = wrap_single_item(item, fnt, mw)
-            all_lines.extend(item_lines)
+def _fit_text(
+    text: str, max_width: int, max_height: int, fontsize: int
+) -> tuple[int, list[tuple[str, int]]]:
+    """
+    Find the largest font size (8 to fontsize) whose wrapped text fits the box.
+    Returns (fontsize, lines); falls back to the minimum size if nothing fits.
+    """
+    # Split into list items and words once - only the measuring depends on font size
+    items = [
+        (marker, content.split())
+        for marker, content in map(_detect_list_item, _split_list_items(text))
+    ]
 
-        return all_lines
+    def layout(size):
+        size_lines = _wrap_items(items, _get_font(size), max_width, fontsize)
+        return size_lines, len(size_lines) * (size + 2) <= max_height
 
-    # Try progressively smaller fonts until text fits
-    current_fontsize = fontsize
+    # Start from the size that roughly fills the box (~0.6 * fontsize² of area
+    # per character incl. line spacing), then bisect towards the largest size
+    # that fits - a few wraps, however far the guess is off
     min_fontsize = 8  # Increased minimum for readability
+    guess = int(math.sqrt(max_width * max_height * 1.6 / max(1, len(text))))
+    guess = max(min_fontsize, min(fontsize, guess))
+
+    lines, fits = layout(guess)
+    if fits:
+        best, best_lines = guess, lines
+        low, high = guess + 1, fontsize
+    else:
+        best, best_lines = None, None
+        low, high = min_fontsize, guess - 1
+
+    while low <= high:
+        mid = (low + high) // 2
+        lines, fits = layout(mid)
+        if fits:
+            best, best_lines = mid, lines
+            low = mid + 1
+        else:
+            high = mid - 1
 
-    while current_fontsize >= min_fontsize:
-        font = _get_font(current_fontsize)
-        lines = wrap_text_with_lists(text, font, max_width)
-        line_height = current_fontsize + 2
-        total_height = len(lines) * line_height
-
-        if total_height <= max_height:
-            break
+    if best is None:
+        # Too long even at the minimum size - draw it at the minimum anyway
+        if guess == min_fontsize:
+            return guess, lines
+        return min_fontsize, layout(min_fontsize)[0]
+    return best, best_lines
 
-        current_fontsize -= 1
 
-    # Draw lines
+def _draw_wrapped_text(
+    draw,
+    text: str,
+    x: int,
+    y: int,
+    max_width: int,
+    max_height: int,
+    font,
+    fontsize: int,
+) -> bool:
+    """
+    Draw text with word wrapping, auto-shrinking font if needed.
+    Returns False if the text couldn't be drawn.
+    """
+    cache_key = (text, max_width, max_height, fontsize)
+    cached = _LAYOUT_CACHE.get(cache_key)
+    if cached is not None:
+        _LAYOUT_CACHE.move_to_end(cache_key)
+        current_fontsize, lines = cached
+    else:
+        current_fontsize, lines = _fit_text(text, max_width, max_height, fontsize)
+        _LAYOUT_CACHE[cache_key] = (current_fontsize, tuple(lines))
+        if len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+    font = _get_font(current_fontsize)
+
+    # Draw each run of equally-indented lines with one multiline_text call.
+    # Pillow steps lines by the height of "A" plus spacing, so pick spacing
+    # that keeps the same line_height as before.
     line_height = current_fontsize + 2
+    spacing = line_height - font.getbbox("A")[3]
     current_y = y
 
-    for line_text, indent in lines:
-        try:
-            draw.text((x + indent, current_y), line_text, fill=(0, 0, 0), font=font)
-        except Exception:
-            draw.text((x + indent, current_y), line_text, fill=(0, 0, 0))
-        current_y += line_height
+    try:
+        for indent, run in groupby(lines, key=itemgetter(1)):
+            run_text = "\n".join(line_text for line_text, _ in run)
+            draw.multiline_text(
+                (x + indent, current_y), run_text, fill=(0, 0, 0), font=font, spacing=spacing
+            )
+            current_y += (run_text.count("\n") + 1) * line_height
+    except Exception:
+        activity.logger.warning(f"Failed to draw text block at ({x}, {y})")
+        return False
+    return True
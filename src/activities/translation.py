@@ -1,7 +1,12 @@
 """Translation activities using Google Cloud Translation API."""
 
+import asyncio
+import functools
+import hashlib
 import os
+import sqlite3
 from dataclasses import dataclass
+from pathlib import Path
 
 from temporalio import activity
 from google.cloud import translate_v3 as translate
@@ -15,9 +20,17 @@ PROJECT_ID = os.getenv("ProjectID")
 TRANSLATE_LOCATION = "us-central1"
 CREDENTIALS_PATH = os.getenv("CREDENTIALS_PATH")
 
+# On-disk cache of previous translations, shared by all workers on this machine
+TRANSLATION_CACHE_PATH = os.getenv(
+    "TRANSLATION_CACHE_PATH", ".cache/translations.sqlite3"
+)
+# Seconds to wait on a locked cache before going without it (it's best-effort)
+TRANSLATION_CACHE_TIMEOUT = 5
 
+
+@functools.lru_cache(maxsize=1)
 def get_credentials():
-    """Load Google Cloud credentials."""
+    """Load Google Cloud credentials (parsed once per worker process)."""
     if not CREDENTIALS_PATH:
         raise ValueError(
             "CREDENTIALS_PATH environment variable not set. "
@@ -26,6 +39,20 @@ def get_credentials():
     return service_account.Credentials.from_service_account_file(CREDENTIALS_PATH)
 
 
+# Per-request limits: the API allows 1024 segments and 30k code points
+MAX_SEGMENTS_PER_REQUEST = 1024
+MAX_CHARS_PER_REQUEST = 28_000
+
+
+@functools.lru_cache(maxsize=1)
+def _get_translate_client() -> translate.TranslationServiceAsyncClient:
+    """
+    Shared async Translation client so the gRPC channel is reused across activities.
+    Must first be called from the worker's event loop, which the channel binds to.
+    """
+    return translate.TranslationServiceAsyncClient(credentials=get_credentials())
+
+
 @dataclass
 class TranslatedBlock:
     """A text block with translation."""
@@ -54,45 +81,69 @@ async def translate_blocks_activity(
 ) -> TranslationResult:
     """
     Translate a list of text blocks.
+    Previously translated strings are served from the on-disk cache.
     """
     activity.logger.info(f"Translating {len(blocks)} blocks")
 
+    # SQLite calls block (up to TRANSLATION_CACHE_TIMEOUT on a locked file),
+    # so keep them off the event loop
+    cache = await asyncio.to_thread(_open_translation_cache)
     try:
-        credentials = get_credentials()
-        client = translate.TranslationServiceClient(credentials=credentials)
+        client = _get_translate_client()
         parent = f"projects/{PROJECT_ID}/locations/{TRANSLATE_LOCATION}"
 
-        translated_blocks = []
-
-        # Batch translate for efficiency (max 1024 segments per request)
-        batch_size = 100
-        for i in range(0, len(blocks), batch_size):
-            batch = blocks[i : i + batch_size]
-            texts = [b["text"] for b in batch]
-
-            response = client.translate_text(
-                request={
-                    "parent": parent,
-                    "contents": texts,
-                    "source_language_code": source_lang,
-                    "target_language_code": target_lang,
-                    "mime_type": "text/plain",
-                }
-            )
+        # Look up every block in the cache, only send the misses to the API
+        keys = [_cache_key(b["text"], source_lang, target_lang) for b in blocks]
+        translations = await asyncio.to_thread(_cache_lookup, cache, list(set(keys)))
+        misses = sum(key not in translations for key in keys)
+
+        # Repeated strings (headers, labels, warnings) only need translating once
+        pending = list(
+            {
+                key: b["text"] for key, b in zip(keys, blocks) if key not in translations
+            }.items()
+        )
+        activity.logger.info(
+            f"Translation cache: {len(blocks) - misses} hits, {misses} misses "
+            f"({len(pending)} unique)"
+        )
 
-            for j, translation in enumerate(response.translations):
-                block = batch[j]
-                translated_blocks.append(
-                    TranslatedBlock(
-                        original=block["text"],
-                        translated=translation.translated_text,
-                        page=block["page"],
-                        x=block["x"],
-                        y=block["y"],
-                        width=block["width"],
-                        height=block["height"],
-                    )
+        semaphore = asyncio.Semaphore(10)  # Stay within Translation API quota
+
+        async def translate_batch(batch: list[tuple[str, str]]):
+            async with semaphore:
+                response = await client.translate_text(
+                    request={
+                        "parent": parent,
+                        "contents": [text for _, text in batch],
+                        "source_language_code": source_lang,
+                        "target_language_code": target_lang,
+                        "mime_type": "text/plain",
+                    },
                 )
+            return [
+                (key, translation.translated_text)
+                for (key, _), translation in zip(batch, response.translations)
+            ]
+
+        # As few requests as the API limits allow, overlapped since they're pure network I/O
+        results = await asyncio.gather(*map(translate_batch, _chunk_requests(pending)))
+        new_entries = [entry for entries in results for entry in entries]
+        translations.update(new_entries)
+        await asyncio.to_thread(_cache_store, cache, new_entries)
+
+        translated_blocks = [
+            TranslatedBlock(
+                original=block["text"],
+                translated=translations[key],
+                page=block["page"],
+                x=block["x"],
+                y=block["y"],
+                width=block["width"],
+                height=block["height"],
+            )
+            for key, block in zip(keys, blocks)
+        ]
 
         activity.logger.info(f"Translation complete: {len(translated_blocks)} blocks")
 
@@ -108,3 +159,94 @@ async def translate_blocks_activity(
             success=False,
             error=str(e),
         )
+
+    finally:
+        if cache is not None:
+            await asyncio.to_thread(cache.close)
+
+
+def _chunk_requests(pending: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """Split (key, text) pairs into batches within the per-request segment/char limits."""
+    batches = []
+    batch = []
+    batch_chars = 0
+    for entry in pending:
+        chars = len(entry[1])
+        if batch and (
+            len(batch) >= MAX_SEGMENTS_PER_REQUEST
+            or batch_chars + chars > MAX_CHARS_PER_REQUEST
+        ):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(entry)
+        batch_chars += chars
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _cache_key(text: str, source_lang: str, target_lang: str) -> str:
+    """Cache key for a source string and language pair."""
+    return hashlib.blake2b(
+        f"{source_lang}:{target_lang}:{text}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _open_translation_cache() -> sqlite3.Connection | None:
+    """Open the translation cache. Returns None if it can't be used (non-fatal)."""
+    conn = None
+    try:
+        path = Path(TRANSLATION_CACHE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from asyncio.to_thread workers, one call at a time
+        conn = sqlite3.connect(
+            path, timeout=TRANSLATION_CACHE_TIMEOUT, check_same_thread=False
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, translated TEXT NOT NULL)"
+        )
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        activity.logger.warning(f"Translation cache unavailable: {e}")
+        # Setup failed after connecting (locked, read-only, disk full)
+        if conn is not None:
+            conn.close()
+        return None
+
+
+def _cache_lookup(conn: sqlite3.Connection | None, keys: list[str]) -> dict[str, str]:
+    """Return cached translations for the given keys ({} if the cache fails)."""
+    found: dict[str, str] = {}
+    if conn is None:
+        return found
+
+    try:
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, translated FROM translations WHERE key IN ({placeholders})",
+                chunk,
+            )
+            found.update(rows)
+    except sqlite3.Error as e:
+        activity.logger.warning(f"Translation cache lookup failed, translating uncached: {e}")
+        return {}
+    return found
+
+
+def _cache_store(conn: sqlite3.Connection | None, entries: list[tuple[str, str]]):
+    """Persist new translations to the cache."""
+    if conn is None or not entries:
+        return
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translated) VALUES (?, ?)",
+                entries,
+            )
+    except sqlite3.Error as e:
+        activity.logger.warning(f"Translation cache store failed: {e}")
@@ -1,5 +1,6 @@
 """Three-stage hybrid translation cleanup: ftfy → rule-based → LLM."""
 
+import functools
 import os
 import re
 import json
@@ -10,6 +11,71 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Static Stage 3 instructions, sent as the Gemini system instruction. Keeping
+# them identical across requests lets Gemini reuse the cached prompt prefix.
+_CLEANUP_INSTRUCTIONS = """You are helping clean up OCR translations of a Japanese toy instruction manual.
+
+Task: Review the translation blocks you are given and provide a JSON response with:
+1. "remove": array of indices for blocks that should be removed (any remaining noise like partial text, artifact characters)
+2. "corrections": object mapping block indices to corrected translations (fix OCR errors, improve phrasing)
+3. "product_name": corrected product name based on the official name from the product page
+4. "tags": array of applicable tags based on the manual content and product
+
+Available tags:
+- "csm": Complete Selection Modification (premium collectible line)
+- "dx": DX (Deluxe toy line, standard retail)
+- "memorial": Memorial Edition (special commemorative releases)
+- "premium": Premium Bandai (web-exclusive items)
+- "kamen-rider": Kamen Rider franchise
+- "sentai": Super Sentai franchise
+- "ultraman": Ultraman franchise
+
+Tag selection rules:
+- Analyze the product name, manual content, and series references
+- Include product line tags (CSM, DX, Memorial, Premium)
+- Include franchise tags based on series identification
+- Kamen Rider series: Den-O, W, OOO, Fourze, Wizard, Gaim, Drive, Ghost, Ex-Aid, Build, Zi-O, Zero-One, Saber, Revice, Geats, Faiz, Blade, Hibiki, Kabuto, Kiva, Decade
+- Sentai series: Abaranger, Dekaranger, Magiranger, Boukenger, Gekiranger, Go-Onger, Shinkenger, Goseiger, Gokaiger, Go-Busters, Kyoryuger, ToQger, Ninninger
+- Only use tags from the list above
+
+Rules for removal:
+- Remove any remaining noise not caught by earlier cleanup (broken text fragments, artifacts)
+- Keep all actual instructions, warnings, feature descriptions, part names, assembly steps
+
+Rules for corrections:
+- Fix obvious OCR mistakes (spaces in words, broken characters)
+- Improve awkward English phrasing while keeping technical accuracy
+- Use official product name terminology from the official product name given with the blocks
+- Use product context from description to improve terminology accuracy
+- Do NOT translate proper nouns or product feature names"""
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Stage 2 noise checks - plain string/set tests, dispatched on the first character
+_NOISE_PUNCT = frozenset(".!?,;:")
+_NOISE_SYMBOLS = frozenset("©®™")
+_PAGE_NUMBER_RE = re.compile(r"\(\d+\)")
+
+
+def _is_noise(text: str) -> bool:
+    """Whether a stripped translation is noise that stage 2 should remove."""
+    if not text:  # Whitespace only
+        return True
+    lead = text[0]
+    if len(text) == 1 and lead.isascii() and lead.isalnum():  # Single character/digit
+        return True
+    if lead == "(":  # Page numbers: (1), (2), etc.
+        return _PAGE_NUMBER_RE.fullmatch(text) is not None
+    if lead == "B":  # Manufacturer name
+        return text == "BANDAI"
+    if lead in _NOISE_PUNCT:  # Lone punctuation
+        return _NOISE_PUNCT.issuperset(text)
+    if lead in _NOISE_SYMBOLS:  # Copyright symbols alone
+        return _NOISE_SYMBOLS.issuperset(text)
+    return False
+
+
 class GeminiCleanupResponse(BaseModel):
     """Validated response from Gemini cleanup."""
 
@@ -45,6 +111,14 @@ class CleanupResult(BaseModel):
     error: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=8192)
+def _fix_text(text: str) -> str:
+    """ftfy.fix_text, cached - manuals repeat part names, labels and warnings."""
+    import ftfy
+
+    return ftfy.fix_text(text)
+
+
 def stage1_ftfy_cleanup(translations_data: dict) -> int:
     """
     Stage 1: Fix encoding and OCR text issues using ftfy.
@@ -55,13 +129,15 @@ def stage1_ftfy_cleanup(translations_data: dict) -> int:
     Returns:
         Number of blocks fixed
     """
-    import ftfy
-
     fixes = 0
     for page in translations_data["pages"]:
         for block in page["blocks"]:
             original = block["translation"]
-            fixed = ftfy.fix_text(original)
+            # Printable ASCII with no "&" (HTML entities) has nothing for ftfy to
+            # fix - control characters, \r and escapes are all non-printable
+            if original.isascii() and original.isprintable() and "&" not in original:
+                continue
+            fixed = _fix_text(original)
             if fixed != original:
                 block["translation"] = fixed
                 fixes += 1
@@ -89,34 +165,28 @@ def stage2_rule_based_cleanup(translations_data: dict) -> int:
     """
     removed = 0
 
-    # Patterns to remove
-    patterns = [
-        r"^\(\d+\)$",  # Page numbers: (1), (2), etc.
-        r"^[.!?,;:]+$",  # Lone punctuation
-        r"^[a-zA-Z0-9]$",  # Single character/digit
-        r"^[©®™]+$",  # Copyright symbols alone
-        r"^BANDAI$",  # Manufacturer name
-        r"^\s*$",  # Whitespace only
-    ]
-
-    compiled_patterns = [re.compile(p) for p in patterns]
-
     for page in translations_data["pages"]:
-        blocks_to_keep = []
-        for block in page["blocks"]:
-            text = block["translation"].strip()
-
-            # Check if text matches any removal pattern
-            should_remove = any(pattern.match(text) for pattern in compiled_patterns)
+        blocks = page["blocks"]
+        page["blocks"] = [
+            block for block in blocks if not _is_noise(block["translation"].strip())
+        ]
+        removed += len(blocks) - len(page["blocks"])
+
+    # Keep the block count in meta in sync - the site index reads it from there
+    if removed:
+        translations_data["meta"]["blocks"] = sum(
+            len(page["blocks"]) for page in translations_data["pages"]
+        )
 
-            if not should_remove:
-                blocks_to_keep.append(block)
-            else:
-                removed += 1
+    return removed
 
-        page["blocks"] = blocks_to_keep
 
-    return removed
+def _parse_block_index(index_key: str) -> Optional[tuple[int, int]]:
+    """Parse a "page-block" index from Gemini into (page, block), or None if malformed."""
+    page, sep, block = index_key.partition("-")
+    if not (sep and page.isdecimal() and block.isdecimal()):
+        return None
+    return int(page), int(block)
 
 
 def stage3_gemini_cleanup(
@@ -158,43 +228,9 @@ Product URL: {translations_data['meta'].get('source_url', '')}"""
     if product_description:
         product_context += f"\nProduct Description: {product_description}"
 
-    prompt = f"""You are helping clean up OCR translations of a Japanese toy instruction manual.
-
-{product_context}
-
-Task: Review these translation blocks and provide a JSON response with:
-1. "remove": array of indices for blocks that should be removed (any remaining noise like partial text, artifact characters)
-2. "corrections": object mapping block indices to corrected translations (fix OCR errors, improve phrasing)
-3. "product_name": corrected product name based on the official name from the product page
-4. "tags": array of applicable tags based on the manual content and product
-
-Available tags:
-- "csm": Complete Selection Modification (premium collectible line)
-- "dx": DX (Deluxe toy line, standard retail)
-- "memorial": Memorial Edition (special commemorative releases)
-- "premium": Premium Bandai (web-exclusive items)
-- "kamen-rider": Kamen Rider franchise
-- "sentai": Super Sentai franchise
-- "ultraman": Ultraman franchise
-
-Tag selection rules:
-- Analyze the product name, manual content, and series references
-- Include product line tags (CSM, DX, Memorial, Premium)
-- Include franchise tags based on series identification
-- Kamen Rider series: Den-O, W, OOO, Fourze, Wizard, Gaim, Drive, Ghost, Ex-Aid, Build, Zi-O, Zero-One, Saber, Revice, Geats, Faiz, Blade, Hibiki, Kabuto, Kiva, Decade
-- Sentai series: Abaranger, Dekaranger, Magiranger, Boukenger, Gekiranger, Go-Onger, Shinkenger, Goseiger, Gokaiger, Go-Busters, Kyoryuger, ToQger, Ninninger
-- Only use tags from the list above
-
-Rules for removal:
-- Remove any remaining noise not caught by earlier cleanup (broken text fragments, artifacts)
-- Keep all actual instructions, warnings, feature descriptions, part names, assembly steps
-
-Rules for corrections:
-- Fix obvious OCR mistakes (spaces in words, broken characters)
-- Improve awkward English phrasing while keeping technical accuracy
-- Use official product name terminology from: {product_name}
-- Use product context from description to improve terminology accuracy
-- Do NOT translate proper nouns or product feature names
+    # Only the product context and blocks vary per manual; the instructions go
+    # in system_instruction so every request starts with the same prefix
+    prompt = f"""{product_context}
 
 Current product name: {translations_data['meta'].get('manual_name', '')}
 Official product name: {product_name}
@@ -223,19 +259,23 @@ Blocks to review:
 
     try:
         # Call Gemini via AI Studio API
-        model_obj = genai.GenerativeModel(model)
+        model_obj = genai.GenerativeModel(
+            model, system_instruction=_CLEANUP_INSTRUCTIONS
+        )
         response = model_obj.generate_content(prompt)
 
         # Parse response
         llm_response = response.text
 
-        # Extract JSON from response
+        # Extract JSON from response - parse the object starting at the first
+        # "{" in place, ignoring any text (e.g. a closing code fence) after it
         json_start = llm_response.find("{")
-        json_end = llm_response.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            raw_json = json.loads(llm_response[json_start:json_end])
-        else:
+        if json_start < 0:
             return (0, None, None, "Could not parse LLM response")
+        try:
+            raw_json, _ = _JSON_DECODER.raw_decode(llm_response, json_start)
+        except json.JSONDecodeError as e:
+            return (0, None, None, f"JSON parse failed: {e}")
 
         # Validate with Pydantic
         try:
@@ -248,27 +288,42 @@ Blocks to review:
                 f"Pydantic validation failed: {str(validation_error)[:100]}",
             )
 
-        # Apply removals
-        removed_count = 0
-        remove_indices = set(cleanup_data.remove)
-        for page_idx in range(len(translations_data["pages"]) - 1, -1, -1):
-            page = translations_data["pages"][page_idx]
-            for block_idx in range(len(page["blocks"]) - 1, -1, -1):
-                index_key = f"{page_idx}-{block_idx}"
-                if index_key in remove_indices:
-                    page["blocks"].pop(block_idx)
-                    removed_count += 1
-
-        # Apply corrections
+        # "page-block" keys are only used in the JSON; parse them once
+        pages = translations_data["pages"]
+        remove_indices = {
+            index for index in map(_parse_block_index, cleanup_data.remove) if index
+        }
+        corrections = {
+            index: corrected_text
+            for index_key, corrected_text in cleanup_data.corrections.items()
+            if (index := _parse_block_index(index_key))
+        }
+
+        # Apply corrections before removals - both refer to the positions
+        # the blocks had when they were sent to Gemini
         corrections_count = 0
-        for index_key, corrected_text in cleanup_data.corrections.items():
-            page_idx, block_idx = map(int, index_key.split("-"))
-            if page_idx < len(translations_data["pages"]):
-                page = translations_data["pages"][page_idx]
+        for (page_idx, block_idx), corrected_text in corrections.items():
+            if page_idx < len(pages):
+                page = pages[page_idx]
                 if block_idx < len(page["blocks"]):
                     page["blocks"][block_idx]["translation"] = corrected_text
                     corrections_count += 1
 
+        # Apply removals
+        removed_count = 0
+        for page_idx, page in enumerate(pages):
+            blocks = page["blocks"]
+            page["blocks"] = [
+                block
+                for block_idx, block in enumerate(blocks)
+                if (page_idx, block_idx) not in remove_indices
+            ]
+            removed_count += len(blocks) - len(page["blocks"])
+        if removed_count:
+            translations_data["meta"]["blocks"] = sum(
+                len(page["blocks"]) for page in pages
+            )
+
         # Get product name
         corrected_name = cleanup_data.product_name.strip()
         if corrected_name and corrected_name != translations_data["meta"].get(
@@ -23,6 +23,11 @@ from src.workflows import PDFTranslationWorkflow, PDFTranslationInput, WorkflowP
 
 TASK_QUEUE = "pdf-translation"
 
+# Seconds the CLI keeps retrying an unreachable workflow before giving up on it.
+# Giving up only stops waiting; the workflow stays in Temporal.
+WORKFLOW_UNREACHABLE_TIMEOUT = 120
+WORKFLOW_RESULT_TIMEOUT = 60
+
 # Load environment variables
 load_dotenv()
 
@@ -214,11 +219,13 @@ def translate(pdf_path_or_url, source_lang, target_lang, workers, skip_cleanup,
             ) as bar:
                 completed_phases = 0
                 url_prompted = False  # Track if we've already prompted for URL
+                last_contact = time.monotonic()
 
                 while True:
                     try:
                         # Query workflow progress
                         progress = await handle.query(PDFTranslationWorkflow.get_progress)
+                        last_contact = time.monotonic()
 
                         # Handle URL prompt if workflow is waiting
                         if progress.waiting_for_url and not url_prompted:
@@ -354,11 +361,26 @@ def translate(pdf_path_or_url, source_lang, target_lang, workers, skip_cleanup,
                         await asyncio.sleep(0.5)
 
                     except Exception as e:
-                        # Workflow might not be ready for queries yet
+                        # Workflow might not be ready for queries yet - but don't
+                        # poll forever if it never answers (e.g. workers are stuck)
+                        if time.monotonic() - last_contact > WORKFLOW_UNREACHABLE_TIMEOUT:
+                            click.echo("")
+                            click.secho("✗ Lost contact with the workflow", fg="red", bold=True)
+                            click.echo(f"  Error: {e}")
+                            click.echo(f"  Workflow ID: {workflow_id} (resumes when a worker is running)")
+                            sys.exit(1)
                         await asyncio.sleep(0.5)
 
-            # Wait for final result
-            result = await handle.result()
+            # Wait for final result - the workflow already reported completion,
+            # so this should be immediate; don't hang if it never arrives
+            try:
+                result = await asyncio.wait_for(
+                    handle.result(), timeout=WORKFLOW_RESULT_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                click.secho("✗ Timed out waiting for the workflow result", fg="red", bold=True)
+                click.echo(f"  Workflow ID: {workflow_id}")
+                sys.exit(1)
             return result
 
         result = asyncio.run(run_translation())
@@ -429,8 +451,8 @@ def add_url(manual_name, source_url):
       toku add-url "CSM-Fang-Memory" "https://tokullectibles.com/products/csm-fang-memory"
       toku add-url "CSM-Fang-Memory"  # Auto-search
     """
-    import json
     from src.activities import _generate_main_index
+    from src.activities._io import load_translations, save_translations
     from src.tokullectibles import search_tokullectibles
 
     manuals_dir = Path("manuals")
@@ -439,9 +461,15 @@ def add_url(manual_name, source_url):
     if not json_path.exists():
         click.secho(f"✗ Error: {json_path} not found", fg="red")
         click.echo("\nAvailable manuals:")
-        for folder in sorted(manuals_dir.iterdir()):
-            if folder.is_dir() and (folder / "translations.json").exists():
-                click.echo(f"  - {folder.name}")
+        with os.scandir(manuals_dir) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "translations.json"))
+            )
+        for name in names:
+            click.echo(f"  - {name}")
         sys.exit(1)
 
     # If no URL provided, try to search Tokullectibles
@@ -465,15 +493,13 @@ def add_url(manual_name, source_url):
             sys.exit(1)
 
     # Read existing data
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_translations(json_path)
 
     # Update metadata
     data["meta"]["source_url"] = source_url
 
     # Write back
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_translations(json_path, data)
 
     click.secho(f"✓ Added source URL to {manual_name}", fg="green")
     click.echo(f"  URL: {source_url}")
@@ -504,7 +530,7 @@ def reindex():
 @cli.command()
 def list():
     """List all translated manuals."""
-    import json
+    from src.activities.site_generation import _read_manual_meta
 
     manuals_dir = Path("manuals")
 
@@ -512,27 +538,27 @@ def list():
         click.secho("✗ Error: manuals/ directory not found", fg="red")
         sys.exit(1)
 
-    manuals = []
-    for folder in sorted(manuals_dir.iterdir()):
-        if not folder.is_dir():
-            continue
+    # One directory listing (is_dir() uses the cached d_type), and only each
+    # manual's meta is parsed - not its pages
+    with os.scandir(manuals_dir) as entries:
+        folders = sorted(
+            (entry for entry in entries if entry.is_dir()), key=lambda e: e.name
+        )
 
-        json_path = folder / "translations.json"
+    manuals = []
+    for folder in folders:
+        json_path = Path(folder.path) / "translations.json"
         if not json_path.exists():
             continue
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        meta = data.get("meta", {})
-        pages = data.get("pages", [])
+        meta = _read_manual_meta(json_path)
 
         manuals.append(
             {
                 "name": folder.name,
                 "source": meta.get("source", ""),
-                "pages": len(pages),
-                "blocks": sum(len(p.get("blocks", [])) for p in pages),
+                "pages": meta["pages"],
+                "blocks": meta["blocks"],
                 "has_url": bool(meta.get("source_url")),
             }
         )
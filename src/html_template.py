@@ -1,16 +1,8 @@
 """Optimized HTML templates for tokuSolutions."""
 
-
-def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
-    """Generate minimal HTML that loads translations.json dynamically."""
-
-    source_link = (
-        f'<a href="{source_url}" class="btn" target="_blank">📄 Original</a>'
-        if source_url
-        else ""
-    )
-
-    return f"""<!DOCTYPE html>
+# Templates are module-level constants filled with str.format_map, so the
+# large literals are built once at import instead of on every call.
+_MANUAL_VIEWER_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -178,6 +170,7 @@ def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
         function renderPages() {{
             const pagePanel = document.getElementById('pagePanel');
             const pages = translationsData.pages;
+            const fragment = document.createDocumentFragment();
 
             pages.forEach((page, idx) => {{
                 const pageDiv = document.createElement('div');
@@ -198,11 +191,15 @@ def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
 
                 pageDiv.appendChild(img);
                 pageDiv.appendChild(label);
-                pagePanel.appendChild(pageDiv);
+                fragment.appendChild(pageDiv);
             }});
+
+            pagePanel.appendChild(fragment);
         }}
 
         function renderOverlays(pageDiv, page, imgWidth, imgHeight) {{
+            const fragment = document.createDocumentFragment();
+
             page.blocks.forEach((block, blockIdx) => {{
                 const overlay = document.createElement('div');
                 overlay.className = 'overlay';
@@ -229,13 +226,16 @@ def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
                     highlightBlock(blockIdx);
                 }});
 
-                pageDiv.appendChild(overlay);
+                fragment.appendChild(overlay);
             }});
+
+            pageDiv.appendChild(fragment);
         }}
 
         function renderTextList() {{
             const textList = document.getElementById('textList');
             const pages = translationsData.pages;
+            const fragment = document.createDocumentFragment();
 
             pages.forEach((page, pageIdx) => {{
                 page.blocks.forEach((block, blockIdx) => {{
@@ -264,9 +264,11 @@ def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
                         document.getElementById(`page-${{pageIdx}}`).scrollIntoView({{ behavior: 'smooth', block: 'center' }});
                     }});
 
-                    textList.appendChild(item);
+                    fragment.appendChild(item);
                 }});
             }});
+
+            textList.appendChild(fragment);
         }}
 
         function highlightBlock(blockId) {{
@@ -282,14 +284,7 @@ def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
 </body>
 </html>"""
 
-
-def generate_main_index_html(manuals: list[dict]) -> str:
-    """Generate main index.html with search."""
-    import json
-
-    manuals_json = json.dumps(manuals)
-
-    return f"""<!DOCTYPE html>
+_MAIN_INDEX_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -307,7 +302,7 @@ def generate_main_index_html(manuals: list[dict]) -> str:
                     <input type="text" id="searchInput" placeholder="Search manuals by name..." />
                 </div>
                 <div class="stats">
-                    <span id="statsDisplay">{len(manuals)} manuals</span>
+                    <span id="statsDisplay">{manual_count} manuals</span>
                 </div>
             </div>
         </header>
@@ -324,7 +319,7 @@ def generate_main_index_html(manuals: list[dict]) -> str:
     </div>
 
     <script>
-        const manuals = {manuals_json};
+        const manuals = JSON.parse({manuals_json});
         const grid = document.getElementById('manualsGrid');
         const searchInput = document.getElementById('searchInput');
         const statsDisplay = document.getElementById('statsDisplay');
@@ -389,3 +384,32 @@ def generate_main_index_html(manuals: list[dict]) -> str:
     </script>
 </body>
 </html>"""
+
+
+def generate_manual_viewer_html(title: str, source_url: str = "") -> str:
+    """Generate minimal HTML that loads translations.json dynamically."""
+
+    source_link = (
+        f'<a href="{source_url}" class="btn" target="_blank">📄 Original</a>'
+        if source_url
+        else ""
+    )
+
+    return _MANUAL_VIEWER_TEMPLATE.format_map(
+        {"title": title, "source_link": source_link}
+    )
+
+
+def generate_main_index_html(manuals: list[dict]) -> str:
+    """Generate main index.html with search."""
+    import json
+
+    # Embed as a JSON string for JSON.parse, which browsers parse faster than
+    # an equivalent object literal. "</" is escaped so it can't close the script.
+    manuals_json = json.dumps(
+        json.dumps(manuals, separators=(",", ":"))
+    ).replace("</", "<\\/")
+
+    return _MAIN_INDEX_TEMPLATE.format_map(
+        {"manual_count": len(manuals), "manuals_json": manuals_json}
+    )
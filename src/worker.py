@@ -2,6 +2,11 @@
 
 import asyncio
 
+try:
+    import uvloop  # Faster event loop for the activity RPCs (not available on Windows)
+except ImportError:
+    uvloop = None
+
 from temporalio.client import Client
 from temporalio.worker import Worker
 
@@ -17,11 +22,14 @@ from src.workflows import (
 from src.activities import (
     get_pdf_page_count_activity,
     ocr_page_activity,
+    ocr_pages_batch_activity,
     translate_blocks_activity,
     generate_site_activity,
+    create_vector_overlay_pdf_activity,
     search_product_url_activity,
     ftfy_cleanup_activity,
     rule_based_cleanup_activity,
+    deterministic_cleanup_activity,
     gemini_cleanup_activity,
 )
 
@@ -44,11 +52,14 @@ async def main():
         activities=[
             get_pdf_page_count_activity,
             ocr_page_activity,
+            ocr_pages_batch_activity,
             translate_blocks_activity,
             generate_site_activity,
+            create_vector_overlay_pdf_activity,
             search_product_url_activity,
             ftfy_cleanup_activity,
             rule_based_cleanup_activity,
+            deterministic_cleanup_activity,
             gemini_cleanup_activity,
         ],
     )
@@ -58,4 +69,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -8,6 +8,7 @@ from temporalio.common import RetryPolicy
 
 with workflow.unsafe.imports_passed_through():
     from src.activities import (
+        deterministic_cleanup_activity,
         ftfy_cleanup_activity,
         rule_based_cleanup_activity,
         gemini_cleanup_activity,
@@ -64,37 +65,59 @@ class CleanupWorkflow:
     async def run(self, input: CleanupInput) -> CleanupOutput:
         workflow.logger.info(f"[Cleanup Workflow] Starting 3-stage cleanup")
 
-        # Stage 1: ftfy (deterministic)
-        workflow.logger.info("[Cleanup 1/3] ftfy - Fixing Unicode/OCR corruption...")
-        ftfy_result = await workflow.execute_activity(
-            ftfy_cleanup_activity,
-            input.json_path,
-            start_to_close_timeout=timedelta(minutes=2),
-            retry_policy=QUICK_RETRY,
-        )
-
         ftfy_fixes = 0
-        if ftfy_result.get("success"):
-            ftfy_fixes = ftfy_result["fixes"]
-            workflow.logger.info(f"[Cleanup 1/3] ✓ Fixed {ftfy_fixes} encoding issues")
-        else:
-            workflow.logger.warning(f"[Cleanup 1/3] Warning: {ftfy_result.get('error')}")
-
-        # Stage 2: Rule-based (deterministic)
-        workflow.logger.info("[Cleanup 2/3] Rule-based - Removing artifacts...")
-        rules_result = await workflow.execute_activity(
-            rule_based_cleanup_activity,
-            input.json_path,
-            start_to_close_timeout=timedelta(minutes=2),
-            retry_policy=QUICK_RETRY,
-        )
-
         rule_removals = 0
-        if rules_result.get("success"):
-            rule_removals = rules_result["removals"]
-            workflow.logger.info(f"[Cleanup 2/3] ✓ Removed {rule_removals} noise blocks")
+
+        # Workflows started before stages 1-2 were combined replay the old
+        # per-stage activities. Drop the else branch (deprecate_patch) once
+        # none of those are left running.
+        if workflow.patched("cleanup-single-activity"):
+            # Stages 1-2: ftfy + rule-based (deterministic), one load/save of the file
+            workflow.logger.info("[Cleanup 1-2/3] ftfy + rule-based - Fixing corruption, removing artifacts...")
+            basic_result = await workflow.execute_activity(
+                deterministic_cleanup_activity,
+                input.json_path,
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=QUICK_RETRY,
+            )
+
+            if basic_result.get("success"):
+                ftfy_fixes = basic_result["fixes"]
+                rule_removals = basic_result["removals"]
+                workflow.logger.info(f"[Cleanup 1/3] ✓ Fixed {ftfy_fixes} encoding issues")
+                workflow.logger.info(f"[Cleanup 2/3] ✓ Removed {rule_removals} noise blocks")
+            else:
+                workflow.logger.warning(f"[Cleanup 1-2/3] Warning: {basic_result.get('error')}")
         else:
-            workflow.logger.warning(f"[Cleanup 2/3] Warning: {rules_result.get('error')}")
+            # Stage 1: ftfy (deterministic)
+            workflow.logger.info("[Cleanup 1/3] ftfy - Fixing Unicode/OCR corruption...")
+            ftfy_result = await workflow.execute_activity(
+                ftfy_cleanup_activity,
+                input.json_path,
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=QUICK_RETRY,
+            )
+
+            if ftfy_result.get("success"):
+                ftfy_fixes = ftfy_result["fixes"]
+                workflow.logger.info(f"[Cleanup 1/3] ✓ Fixed {ftfy_fixes} encoding issues")
+            else:
+                workflow.logger.warning(f"[Cleanup 1/3] Warning: {ftfy_result.get('error')}")
+
+            # Stage 2: Rule-based (deterministic)
+            workflow.logger.info("[Cleanup 2/3] Rule-based - Removing artifacts...")
+            rules_result = await workflow.execute_activity(
+                rule_based_cleanup_activity,
+                input.json_path,
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=QUICK_RETRY,
+            )
+
+            if rules_result.get("success"):
+                rule_removals = rules_result["removals"]
+                workflow.logger.info(f"[Cleanup 2/3] ✓ Removed {rule_removals} noise blocks")
+            else:
+                workflow.logger.warning(f"[Cleanup 2/3] Warning: {rules_result.get('error')}")
 
         # Stage 3: Gemini (non-deterministic, optional)
         gemini_corrections = 0
@@ -0,0 +1,192 @@
+"""Tests for the OCR activities."""
+
+import asyncio
+from unittest import mock
+
+import fitz
+import pytest
+from google.api_core.exceptions import ServiceUnavailable
+from google.cloud import documentai_v1 as documentai
+from temporalio.testing import ActivityEnvironment
+
+from src.activities import ocr
+
+
+def make_document(page_texts: dict[int, str]) -> documentai.Document:
+    """A Document AI result with one text block per page, keyed by 1-based page_number."""
+    full_text = ""
+    pages = []
+    for page_number, text in page_texts.items():
+        start = len(full_text)
+        full_text += text + "\n"
+        layout = documentai.Document.Page.Layout(
+            text_anchor=documentai.Document.TextAnchor(
+                text_segments=[
+                    documentai.Document.TextAnchor.TextSegment(
+                        start_index=start, end_index=start + len(text)
+                    )
+                ]
+            ),
+            bounding_poly=documentai.BoundingPoly(
+                normalized_vertices=[
+                    documentai.NormalizedVertex(x=x, y=y)
+                    for x, y in [(0.1, 0.1), (0.5, 0.1), (0.5, 0.2), (0.1, 0.2)]
+                ]
+            ),
+            confidence=0.9,
+        )
+        pages.append(
+            documentai.Document.Page(
+                page_number=page_number, blocks=[documentai.Document.Page.Block(layout=layout)]
+            )
+        )
+    return documentai.Document(text=full_text, pages=pages)
+
+
+class FakeDocAIClient:
+    """
+    Stands in for the Document AI client. A subset-PDF request returns
+    pdf_pages (or raises pdf_error); every page image reads as "Scanned page".
+    """
+
+    def __init__(self, pdf_pages=None, pdf_error=None):
+        self.pdf_pages = pdf_pages
+        self.pdf_error = pdf_error
+        self.mime_types = []
+
+    async def process_document(self, request):
+        mime_type = request.raw_document.mime_type
+        self.mime_types.append(mime_type)
+        if mime_type != "application/pdf":
+            return documentai.ProcessResponse(document=make_document({1: "Scanned page"}))
+        if self.pdf_error:
+            raise self.pdf_error
+        return documentai.ProcessResponse(
+            document=make_document({n: f"PDF page {n}" for n in self.pdf_pages})
+        )
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "manual.pdf"
+    with fitz.open() as doc:
+        for text in ("First page", "Second page", "Third page"):
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(path)
+    return str(path)
+
+
+def ocr_batch(pdf_path, client, page_nums):
+    with mock.patch.object(ocr, "_get_docai_client", return_value=client):
+        return asyncio.run(
+            ActivityEnvironment().run(ocr.ocr_pages_batch_activity, pdf_path, page_nums)
+        )
+
+
+def block_texts(results):
+    return {r.page_num: [b.text for b in r.blocks] for r in results}
+
+
+@pytest.mark.parametrize(
+    "text, skip",
+    [
+        ("", True),
+        ("12", True),
+        ("③", True),
+        ("3.", True),
+        ("※", True),
+        ("©", True),
+        ("x", True),
+        ("DC", True),
+        ("Dc", False),
+        ("電池を入れる", False),
+        ("3個の電池", False),
+        ("※注意してください", False),
+        ("LED ON", False),
+    ],
+)
+def test_should_skip_block(text, skip):
+    assert ocr._should_skip_block(text) is skip
+
+
+def text_layout(*bounds):
+    return documentai.Document.Page.Layout(
+        text_anchor=documentai.Document.TextAnchor(
+            text_segments=[
+                documentai.Document.TextAnchor.TextSegment(start_index=start, end_index=end)
+                for start, end in bounds
+            ]
+        )
+    )
+
+
+def test_get_text_from_layout():
+    full_text = "電池を入れる\nボタンを押す\n"
+
+    assert ocr._get_text_from_layout(text_layout(), full_text) == ""
+    # start_index 0 is the proto default, so it's unset on the first segment
+    assert ocr._get_text_from_layout(text_layout((0, 6)), full_text) == "電池を入れる"
+    # Contiguous segments are one slice, split ones are joined
+    assert ocr._get_text_from_layout(text_layout((0, 3), (3, 7)), full_text) == "電池を入れる\n"
+    assert ocr._get_text_from_layout(text_layout((0, 2), (7, 13)), full_text) == "電池ボタンを押す"
+
+
+def test_batch_reuses_ocr_for_identical_pages(tmp_path):
+    path = tmp_path / "manual.pdf"
+    with fitz.open() as doc:
+        for text in ("Same page", "Other page", "Same page"):
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(path)
+
+    client = FakeDocAIClient(pdf_error=ServiceUnavailable("unavailable"))
+    results = ocr_batch(str(path), client, [0, 1, 2])
+
+    # Pages 0 and 2 render identically, so only two images are sent
+    assert client.mime_types == ["application/pdf", "image/jpeg", "image/jpeg"]
+    assert all(r.success for r in results)
+    assert [b.page for b in results[2].blocks] == [2]
+    assert [b.text for b in results[2].blocks] == [b.text for b in results[0].blocks]
+
+
+def test_batch_missing_pdf_fails_each_page(tmp_path):
+    results = asyncio.run(
+        ActivityEnvironment().run(
+            ocr.ocr_pages_batch_activity, str(tmp_path / "missing.pdf"), [0, 1, 2]
+        )
+    )
+
+    assert [r.page_num for r in results] == [0, 1, 2]
+    assert not any(r.success for r in results)
+    assert all("missing.pdf" in r.error for r in results)
+
+
+def test_batch_maps_subset_pages_to_original_numbers(pdf_path):
+    client = FakeDocAIClient(pdf_pages=[1, 2])
+    results = ocr_batch(pdf_path, client, [2, 0])
+
+    assert client.mime_types == ["application/pdf"]
+    assert block_texts(results) == {2: ["PDF page 1"], 0: ["PDF page 2"]}
+    assert all(b.page == r.page_num for r in results for b in r.blocks)
+
+
+def test_batch_request_error_falls_back_to_page_images(pdf_path):
+    client = FakeDocAIClient(pdf_error=ServiceUnavailable("unavailable"))
+    results = ocr_batch(pdf_path, client, [0, 1, 2])
+
+    assert client.mime_types == ["application/pdf"] + ["image/jpeg"] * 3
+    assert all(r.success for r in results)
+    assert block_texts(results) == {p: ["Scanned page"] for p in (0, 1, 2)}
+
+
+def test_batch_short_response_only_reocrs_missing_pages(pdf_path):
+    """A processed (billed) response isn't resent; only its missing pages are."""
+    client = FakeDocAIClient(pdf_pages=[1, 3])
+    results = ocr_batch(pdf_path, client, [0, 1, 2])
+
+    assert client.mime_types == ["application/pdf", "image/jpeg"]
+    assert all(r.success for r in results)
+    assert block_texts(results) == {
+        0: ["PDF page 1"],
+        1: ["Scanned page"],
+        2: ["PDF page 3"],
+    }
@@ -0,0 +1,145 @@
+"""Tests for the site generation activities."""
+
+import asyncio
+import random
+from unittest import mock
+
+import fitz
+import pytest
+from PIL import ImageDraw
+from temporalio.testing import ActivityEnvironment
+
+from src.activities import site_generation
+from src.activities._io import save_translations
+
+BLOCKS = [
+    {"page": 0, "x": 0.1, "y": 0.07 * i, "width": 0.6, "height": 0.05, "translated": f"Block {i}"}
+    for i in range(1, 13)
+]
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "original.pdf"
+    with fitz.open() as doc:
+        doc.new_page(width=595, height=842)
+        doc.save(path)
+    return str(path)
+
+
+def create_overlay(pdf_path, output_path):
+    return asyncio.run(
+        ActivityEnvironment().run(
+            site_generation.create_overlay_pdf_activity, pdf_path, BLOCKS, output_path
+        )
+    )
+
+
+def test_overlay_tolerates_occasional_draw_failure(pdf_path, tmp_path):
+    draw_text = ImageDraw.ImageDraw.multiline_text
+    calls = []
+
+    def flaky_draw_text(self, *args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OSError("glyph failed")
+        return draw_text(self, *args, **kwargs)
+
+    output_path = str(tmp_path / "overlay.pdf")
+    with mock.patch.object(ImageDraw.ImageDraw, "multiline_text", flaky_draw_text):
+        assert create_overlay(pdf_path, output_path) == output_path
+    assert len(calls) == len(BLOCKS)
+
+
+def test_overlay_fails_when_most_blocks_fail_to_draw(pdf_path, tmp_path):
+    output_path = tmp_path / "overlay.pdf"
+    with (
+        mock.patch.object(ImageDraw.ImageDraw, "multiline_text", side_effect=OSError("bad font")),
+        pytest.raises(RuntimeError, match="12 of 12 text blocks failed to draw"),
+    ):
+        create_overlay(pdf_path, str(output_path))
+    assert not output_path.exists()
+
+
+def top_down_fit(text, max_width, max_height, fontsize):
+    """The original search: step down from fontsize until the text fits."""
+    items = [
+        (marker, content.split())
+        for marker, content in map(
+            site_generation._detect_list_item, site_generation._split_list_items(text)
+        )
+    ]
+    for size in range(fontsize, 7, -1):
+        lines = site_generation._wrap_items(
+            items, site_generation._get_font(size), max_width, fontsize
+        )
+        if len(lines) * (size + 2) <= max_height:
+            return size, lines
+    return 8, lines
+
+
+@pytest.mark.parametrize(
+    "text, max_width, max_height, fontsize",
+    [
+        ("Insert the battery into the belt buckle and press the button. " * 6, 160, 150, 14),
+        ("1. Remove the cover 2. Insert two AA batteries 3. Close the cover " * 3, 150, 130, 14),
+        ("Do not expose to water, heat or direct sunlight for long periods", 60, 16, 10),
+        ("Short label", 200, 30, 14),
+    ],
+)
+def test_fit_text_matches_top_down_search(text, max_width, max_height, fontsize):
+    assert site_generation._fit_text(text, max_width, max_height, fontsize) == top_down_fit(
+        text, max_width, max_height, fontsize
+    )
+
+
+def test_fit_text_matches_top_down_search_for_random_boxes():
+    rng = random.Random(0)
+    words = "press the ① ② 1. 2. ・ battery cover button into belt buckle AA do not".split()
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 80)))
+        max_width, max_height = rng.randint(30, 300), rng.randint(10, 150)
+        fontsize = rng.randint(10, 14)
+        assert site_generation._fit_text(
+            text, max_width, max_height, fontsize
+        ) == top_down_fit(text, max_width, max_height, fontsize), (text, max_width, max_height)
+
+
+@pytest.mark.parametrize(
+    "translated",
+    [
+        "Press “OK” — then ① Ω ≤ 5V",  # Outside Latin-1, inside the overlay TTF
+        "Insert the 単三 battery",  # CJK, which the overlay TTF may not cover
+    ],
+)
+def test_vector_overlay_keeps_non_latin_text(pdf_path, tmp_path, translated):
+    blocks = [{"page": 0, "x": 0.1, "y": 0.1, "width": 0.6, "height": 0.05, "translated": translated}]
+    output_path = str(tmp_path / "overlay.pdf")
+    asyncio.run(
+        ActivityEnvironment().run(
+            site_generation.create_vector_overlay_pdf_activity, pdf_path, blocks, output_path
+        )
+    )
+
+    with fitz.open(output_path) as doc:
+        assert " ".join(doc[0].get_text().split()) == translated
+
+
+def test_manual_meta_recounts_stale_counts(tmp_path):
+    json_path = tmp_path / "translations.json"
+    data = {
+        "meta": {"source": "Manual", "pages": 5, "blocks": 99},
+        "pages": [
+            {"image": "pages/page-0.webp", "blocks": [{"translated": "a"}, {"translated": "b"}]},
+            {"image": "pages/page-1.webp", "blocks": [{"translated": "c"}]},
+        ],
+    }
+    save_translations(json_path, data)
+
+    meta = site_generation._read_manual_meta(json_path)
+    assert (meta["source"], meta["pages"], meta["blocks"]) == ("Manual", 2, 3)
+
+    # An edit that doesn't touch meta still shows up in the counts
+    data["pages"][1]["blocks"].append({"translated": "d"})
+    save_translations(json_path, data)
+    assert site_generation._read_manual_meta(json_path)["blocks"] == 4
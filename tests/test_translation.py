@@ -0,0 +1,105 @@
+"""Tests for the translation activity's on-disk cache."""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from src.activities import translation
+
+BLOCKS = [
+    {"text": text, "page": 0, "x": 0.1, "y": 0.1, "width": 0.2, "height": 0.05}
+    for text in ("電池", "ボタン", "電池")
+]
+
+
+class FakeTranslateClient:
+    """Stands in for TranslationServiceAsyncClient, prefixing each text with EN:."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def translate_text(self, request):
+        self.requests.append(request)
+        return SimpleNamespace(
+            translations=[
+                SimpleNamespace(translated_text=f"EN:{text}") for text in request["contents"]
+            ]
+        )
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Fake API client, with the cache pointed at a temp file and a short lock timeout."""
+    fake = FakeTranslateClient()
+    with (
+        mock.patch.object(translation, "_get_translate_client", return_value=fake),
+        mock.patch.object(translation, "TRANSLATION_CACHE_PATH", str(tmp_path / "cache.sqlite3")),
+        mock.patch.object(translation, "TRANSLATION_CACHE_TIMEOUT", 0.1),
+    ):
+        yield fake
+
+
+def translate():
+    return asyncio.run(ActivityEnvironment().run(translation.translate_blocks_activity, BLOCKS))
+
+
+def assert_translated(result):
+    assert result.success, result.error
+    assert [b.translated for b in result.blocks] == ["EN:電池", "EN:ボタン", "EN:電池"]
+
+
+def test_cache_serves_repeat_translations(client):
+    assert_translated(translate())
+    assert_translated(translate())
+    assert len(client.requests) == 1
+
+
+def test_corrupt_cache_file(client):
+    with open(translation.TRANSLATION_CACHE_PATH, "wb") as f:
+        f.write(b"not a database" * 100)
+
+    assert_translated(translate())
+
+
+def test_cache_locked_for_reads(client):
+    """An exclusive lock (another writer mid-commit) blocks lookups and stores."""
+    assert_translated(translate())
+
+    # Open the cache first so the lock hits the lookup, not the CREATE TABLE
+    conn = translation._open_translation_cache()
+    locker = sqlite3.connect(translation.TRANSLATION_CACHE_PATH)
+    locker.execute("BEGIN EXCLUSIVE")
+    try:
+        with mock.patch.object(translation, "_open_translation_cache", return_value=conn):
+            assert_translated(translate())
+    finally:
+        locker.rollback()
+        locker.close()
+    assert len(client.requests) == 2
+
+
+def test_cache_locked_for_writes(client):
+    """A reserved lock (another open write transaction) only blocks the store."""
+    sqlite3.connect(translation.TRANSLATION_CACHE_PATH).close()
+    locker = sqlite3.connect(translation.TRANSLATION_CACHE_PATH)
+    locker.execute("CREATE TABLE translations (key TEXT PRIMARY KEY, translated TEXT NOT NULL)")
+    locker.commit()
+    locker.execute("BEGIN IMMEDIATE")
+    try:
+        assert_translated(translate())
+    finally:
+        locker.rollback()
+        locker.close()
+
+
+def test_cache_setup_failure_closes_connection(client):
+    """A connection whose CREATE TABLE fails isn't left open."""
+    conn = mock.MagicMock()
+    conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+    with mock.patch.object(translation.sqlite3, "connect", return_value=conn):
+        assert translation._open_translation_cache() is None
+    conn.close.assert_called_once()
@@ -2,7 +2,7 @@
 import { BBOX_DEFAULTS, UI_TIMINGS } from './config.js';
 import { state, DOM, EditSession } from './state.js';
 import { validateBbox, clampBbox, debounce } from './utils.js';
-import { renderOverlays, showEditButtons, hideEditButtons } from './renderer.js';
+import { renderOverlays, showEditButtons, hideEditButtons, ensureBboxEditor } from './renderer.js';
 
 // Enter edit mode for a specific block
 export function enterBlockEditMode(pageIdx, blockIdx) {
@@ -29,9 +29,9 @@ export function enterBlockEditMode(pageIdx, blockIdx) {
   textItem.classList.add('editing');
 
   // Show bbox editor and delete button for this block
-  const bboxEditor = textItem.querySelector('.bbox-editor');
+  const bboxEditor = ensureBboxEditor(textItem, pageIdx, blockIdx);
   const deleteBtn = textItem.querySelector('.delete-btn');
-  if (bboxEditor) bboxEditor.classList.remove('hidden');
+  bboxEditor.classList.remove('hidden');
   if (deleteBtn) deleteBtn.classList.remove('hidden');
 
   // Make translation editable
@@ -145,8 +145,6 @@ export function createTextBlock(pageIdx) {
 
   // Re-render the page
   const pageDiv = document.getElementById(`page-${pageIdx}`);
-  const overlays = pageDiv.querySelectorAll('.overlay');
-  overlays.forEach((overlay) => overlay.remove());
   renderOverlays(pageDiv, page, pageIdx);
 
   // Re-render text list
@@ -182,8 +180,6 @@ export function deleteTextBlock(pageIdx, blockIdx) {
 
   // Re-render
   const pageDiv = document.getElementById(`page-${pageIdx}`);
-  const overlays = pageDiv.querySelectorAll('.overlay');
-  overlays.forEach((overlay) => overlay.remove());
   renderOverlays(pageDiv, page, pageIdx);
 
   import('./renderer.js').then(({ renderTextList }) => {
@@ -372,7 +368,11 @@ export function undoLastEdit() {
   }
 
   // Re-render overlays to reflect bbox changes
-  renderOverlays(pageIdx);
+  renderOverlays(
+    document.getElementById(`page-${pageIdx}`),
+    state.currentManual.pages[pageIdx],
+    pageIdx
+  );
 
   // Clear undo state
   state.lastEdit = null;
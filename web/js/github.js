@@ -20,12 +20,23 @@ export async function submitToGitHub(currentManual) {
   const [owner, repo] = GITHUB_CONFIG.REPO.split('/');
 
   // Generate JSON content
-  const jsonContent = JSON.stringify(currentManual, null, 2);
+  const jsonContent = serializeManual(currentManual);
 
   // Show instructions modal
   showSubmitInstructions(jsonContent, owner, repo, FILE_PATH, manualName);
 }
 
+// Serialize the manual, refreshing meta counts first (the site index reads them
+// instead of counting every page's blocks)
+function serializeManual(currentManual) {
+  currentManual.meta.pages = currentManual.pages.length;
+  currentManual.meta.blocks = currentManual.pages.reduce(
+    (total, page) => total + page.blocks.length,
+    0
+  );
+  return JSON.stringify(currentManual, null, 2);
+}
+
 // Show submit instructions modal
 function showSubmitInstructions(jsonContent, owner, repo, filePath, manualName) {
   // Create modal backdrop
@@ -172,7 +183,7 @@ export function downloadJSON(currentManual) {
 
   const manualName = state.currentManualName || 'manual';
 
-  const jsonContent = JSON.stringify(currentManual, null, 2);
+  const jsonContent = serializeManual(currentManual);
   const blob = new Blob([jsonContent], { type: 'application/json' });
   const url = URL.createObjectURL(blob);
 
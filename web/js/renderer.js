@@ -22,6 +22,9 @@ export function renderManualList(filteredManuals) {
   grid.classList.remove('hidden');
   noResults.classList.add('hidden');
 
+  // Build all cards off-DOM, then insert once
+  const fragment = document.createDocumentFragment();
+
   filteredManuals.forEach((manual) => {
     const card = document.createElement('div');
     card.className = 'card';
@@ -72,9 +75,11 @@ export function renderManualList(filteredManuals) {
       }
     });
 
-    grid.appendChild(card);
+    fragment.appendChild(card);
   });
 
+  grid.appendChild(fragment);
+
   statsDisplay.textContent = `${filteredManuals.length} manual${filteredManuals.length !== 1 ? 's' : ''}`;
 }
 
@@ -178,7 +183,13 @@ export function renderOverlays(pageDiv, page, pageIdx) {
     fragment.appendChild(overlay);
   });
 
-  pageDiv.appendChild(fragment);
+  if (pageDiv.querySelector('.overlay')) {
+    // Re-render: swap the old overlays for the new ones in a single DOM operation
+    const kept = [...pageDiv.children].filter((el) => !el.classList.contains('overlay'));
+    pageDiv.replaceChildren(...kept, fragment);
+  } else {
+    pageDiv.appendChild(fragment);
+  }
 }
 
 // Render text list
@@ -225,12 +236,10 @@ export function renderTextList() {
         translation.style.display = 'none';
       }
 
-      // Add inline bbox editor
-      const bboxEditor = createBboxEditor(block, pageIdx, blockIdx);
-
+      // The inline bbox editor is only built when the block enters edit mode
+      // (see ensureBboxEditor) - building one per block made large lists slow
       item.appendChild(header);
       item.appendChild(translation);
-      item.appendChild(bboxEditor);
 
       // Event listeners - now handled in app.js for direct editing
 
@@ -241,6 +250,17 @@ export function renderTextList() {
   DOM.textList.appendChild(fragment);
 }
 
+// Get a text item's bbox editor, creating it on first use
+export function ensureBboxEditor(textItem, pageIdx, blockIdx) {
+  let bboxEditor = textItem.querySelector('.bbox-editor');
+  if (!bboxEditor) {
+    const block = state.currentManual.pages[pageIdx].blocks[blockIdx];
+    bboxEditor = createBboxEditor(block, pageIdx, blockIdx);
+    textItem.appendChild(bboxEditor);
+  }
+  return bboxEditor;
+}
+
 // Create bbox editor
 function createBboxEditor(block, pageIdx, blockIdx) {
   const bboxEditor = document.createElement('div');